@@ -0,0 +1,45 @@
+"""`afterburner commit` — Git Guardian only."""
+
+import os
+
+import typer
+
+from integrations._console import echo
+from integrations._paths import normalize_repo_path
+
+
+def commit(
+    repo_path: str = typer.Argument(".", help="Path to the git repository to process."),
+    no_pr: bool = typer.Option(False, "--no-pr", help="Skip PR creation."),
+):
+    """Run only the Git Guardian (commit + optional PR)."""
+    repo_path = normalize_repo_path(repo_path)
+    echo("[bold]📦 Creating commit...[/bold]")
+
+    from src.utils.logging import setup_logging
+    from src.agents.change_detector import change_detector_node
+    from src.agents.git_guardian import git_guardian_node
+
+    setup_logging()
+
+    if no_pr:
+        os.environ["AFTERBURNER_AUTO_PR"] = "false"
+
+    state = {
+        "repo_path": repo_path,
+        "changed_files": [],
+        "trigger_source": "cli",
+        "security_passed": True,
+        "tests_passed": True,
+    }
+
+    state.update(change_detector_node(state))
+    result = git_guardian_node(state)
+
+    sha = result.get("commit_sha")
+    pr = result.get("pr_url")
+
+    if sha:
+        echo(f"\n✅ Committed: {sha[:8]}")
+    if pr:
+        echo(f"🔗 PR: {pr}")
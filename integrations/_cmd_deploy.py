@@ -0,0 +1,40 @@
+"""`afterburner deploy` — Launch Controller only."""
+
+import os
+
+import typer
+
+from integrations._console import echo
+from integrations._paths import normalize_repo_path
+
+
+def deploy(
+    repo_path: str = typer.Argument(".", help="Path to the git repository to process."),
+    target: str = typer.Option(None, "--target", "-t", help="Deploy target: vercel | docker"),
+):
+    """Run only the Launch Controller (deploy + monitoring)."""
+    repo_path = normalize_repo_path(repo_path)
+    echo("[bold]🚀 Deploying...[/bold]")
+
+    if target:
+        os.environ["AFTERBURNER_DEPLOY_TARGET"] = target
+
+    from src.utils.logging import setup_logging
+    from src.agents.launch_controller import launch_controller_node
+
+    setup_logging()
+
+    state = {
+        "repo_path": repo_path,
+        "skip_deploy": False,
+    }
+
+    result = launch_controller_node(state)
+
+    status = result.get("deployment_status", "unknown")
+    url = result.get("deployment_url")
+    icon = "✅" if status == "success" else "❌"
+
+    echo(f"\n{icon} Deploy status: {status}")
+    if url:
+        echo(f"🔗 URL: {url}")
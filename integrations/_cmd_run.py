@@ -0,0 +1,54 @@
+"""`afterburner run` — full pipeline command."""
+
+import os
+
+import typer
+
+from integrations._console import echo, echo_markdown, echo_panel
+from integrations._paths import normalize_repo_path
+
+
+def run(
+    repo_path: str = typer.Argument(
+        ".",
+        help="Path to the git repository to process.",
+    ),
+    skip_deploy: bool = typer.Option(
+        False,
+        "--skip-deploy",
+        help="Skip deployment step.",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose", "-v",
+        help="Enable verbose output.",
+    ),
+):
+    """Run the full Afterburner pipeline: detect → security → test → git → deploy."""
+    repo_path = normalize_repo_path(repo_path)
+
+    if verbose:
+        os.environ["AFTERBURNER_VERBOSE"] = "true"
+
+    echo_panel(
+        "🔥 [bold red]Afterburner[/bold red] — Post-Write Companion\n"
+        f"📂 Repo: {repo_path}",
+        border_style="red",
+    )
+
+    from src.graph.workflow import run_afterburner
+
+    result = run_afterburner(
+        repo_path=repo_path,
+        trigger_source="cli",
+        skip_deploy=skip_deploy,
+    )
+
+    # Display summary
+    summary = result.get("final_summary", "No summary generated.")
+    echo()
+    echo_markdown(summary)
+
+    # Exit code
+    if result.get("hard_fail"):
+        raise typer.Exit(code=1)
@@ -0,0 +1,39 @@
+"""`afterburner security` — Security Sentinel only."""
+
+import typer
+
+from integrations._console import echo
+from integrations._paths import normalize_repo_path
+
+
+def security(
+    repo_path: str = typer.Argument(".", help="Path to the git repository to process."),
+):
+    """Run only the Security Sentinel (Semgrep + Bandit)."""
+    repo_path = normalize_repo_path(repo_path)
+    echo("[bold]🛡️ Running security scan only...[/bold]")
+
+    from src.utils.logging import setup_logging
+    from src.agents.change_detector import change_detector_node
+    from src.agents.security_sentinel import security_sentinel_node
+
+    setup_logging()
+
+    # Minimal state for change detection + security
+    state = {
+        "repo_path": repo_path,
+        "changed_files": [],
+        "trigger_source": "cli",
+        "reflection_count": 0,
+    }
+
+    state.update(change_detector_node(state))
+    result = security_sentinel_node(state)
+
+    passed = result.get("security_passed", True)
+    count = result.get("security_issues_count", 0)
+    icon = "✅" if passed else "❌"
+
+    echo(f"\n{icon} Security scan: {count} issue(s) found")
+    if not passed:
+        raise typer.Exit(code=1)
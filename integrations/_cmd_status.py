@@ -0,0 +1,23 @@
+"""`afterburner status` — configuration overview."""
+
+from integrations._console import echo_panel
+
+
+def status():
+    """Show Afterburner configuration."""
+    from src.config import settings
+
+    echo_panel(
+        f"[bold]LLM Provider:[/bold] {settings.LLM_PROVIDER}\n"
+        f"[bold]LLM Model:[/bold] {settings.LLM_MODEL}\n"
+        f"[bold]GitHub Repo:[/bold] {settings.GITHUB_REPO or 'Not configured'}\n"
+        f"[bold]Auto PR:[/bold] {settings.AUTO_PR}\n"
+        f"[bold]Semgrep:[/bold] {settings.ENABLE_SEMGREP}\n"
+        f"[bold]Bandit:[/bold] {settings.ENABLE_BANDIT}\n"
+        f"[bold]Deploy Target:[/bold] {settings.DEPLOY_TARGET or 'None'}\n"
+        f"[bold]Max Test Retries:[/bold] {settings.MAX_TEST_DEBUG_ITERATIONS}\n"
+        f"[bold]Max Reflection Retries:[/bold] {settings.MAX_REFLECTION_RETRIES}\n"
+        f"[bold]Verbose:[/bold] {settings.VERBOSE}",
+        title="🔥 Afterburner Config",
+        border_style="red",
+    )
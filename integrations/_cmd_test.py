@@ -0,0 +1,68 @@
+"""`afterburner test` — Test Pilot only."""
+
+from typing import Any, Dict, List, Tuple
+
+import typer
+
+from integrations._console import echo
+from integrations._paths import normalize_repo_path
+
+
+def test(
+    repo_path: str = typer.Argument(".", help="Path to the git repository to process."),
+    max_retries: int = typer.Option(4, "--max-retries"),
+):
+    """Run only the Test Pilot (auto-detect framework + self-debug loop)."""
+    repo_path = normalize_repo_path(repo_path)
+    echo("[bold]🧪 Running tests only...[/bold]")
+
+    from src.utils.logging import setup_logging
+    from src.agents.change_detector import change_detector_node
+    from src.agents.test_pilot import test_pilot_node
+
+    setup_logging()
+
+    state = {
+        "repo_path": repo_path,
+        "changed_files": [],
+        "trigger_source": "cli",
+        "test_debug_iterations": 0,
+    }
+
+    state.update(change_detector_node(state))
+
+    # Self-debug loop
+    previous_failure = None
+    for i in range(max_retries):
+        result = test_pilot_node(state)
+        state.update(result)
+
+        if result.get("tests_passed", False):
+            echo(f"\n✅ All tests passed (iteration {i + 1})")
+            return
+
+        echo(f"\n⚠️ Tests failed (iteration {i + 1}/{max_retries})")
+
+        # Identical failures twice in a row — further retries won't change anything
+        failure = _failure_signature(result.get("test_results", []))
+        if failure == previous_failure:
+            echo("[dim]Same failures as the previous run — stopping early[/dim]")
+            break
+        previous_failure = failure
+
+    echo("\n❌ Tests still failing after all retries")
+    raise typer.Exit(code=1)
+
+
+def _failure_signature(results: List[Dict[str, Any]]) -> Tuple:
+    """
+    Reduce a run's test results to the parts that identify its failures.
+
+    Raw output is left out on purpose — it carries timings that differ on
+    every run even when the same tests fail the same way.
+    """
+    return tuple(
+        (r.get("framework"), r.get("failed"), tuple(r.get("errors", [])))
+        for r in results
+        if r.get("failed") or r.get("errors")
+    )
@@ -0,0 +1,70 @@
+"""Shared console output for the CLI commands.
+
+Rich rendering is only used on an interactive terminal. When stdout is piped
+(CI, log files) or ``NO_COLOR`` is set, output degrades to plain ``print`` and
+Rich is never imported.
+"""
+
+import os
+import re
+import sys
+from typing import Optional
+
+_console_instance = None
+_pretty: Optional[bool] = None
+
+# Rich markup tags such as [bold], [/bold red], [dim]
+_RICH_TAG_RE = re.compile(r"\[/?[a-zA-Z][\w\s#.,=-]*\]")
+
+
+def get_console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
+
+
+def is_pretty() -> bool:
+    """True when stdout is a TTY and NO_COLOR is unset."""
+    global _pretty
+    if _pretty is None:
+        _pretty = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+    return _pretty
+
+
+def strip_markup(text: str) -> str:
+    """Remove Rich markup tags, leaving the plain text."""
+    return _RICH_TAG_RE.sub("", text)
+
+
+def echo(text: str = "") -> None:
+    """Print a line that may contain Rich markup."""
+    if is_pretty():
+        get_console().print(text)
+    else:
+        print(strip_markup(text))
+
+
+def echo_panel(text: str, title: Optional[str] = None, border_style: str = "red") -> None:
+    """Print ``text`` in a fitted Rich panel, or as plain lines off-TTY."""
+    if is_pretty():
+        from rich.panel import Panel
+
+        get_console().print(Panel.fit(text, title=title, border_style=border_style))
+        return
+    if title:
+        print(strip_markup(title))
+    print(strip_markup(text))
+
+
+def echo_markdown(markdown: str) -> None:
+    """Render Markdown on a TTY; otherwise print the raw (already readable) source."""
+    if is_pretty():
+        from rich.markdown import Markdown
+
+        get_console().print(Markdown(markdown))
+    else:
+        print(markdown)
@@ -0,0 +1,21 @@
+"""Repository path normalisation shared by the CLI, MCP and API entry points."""
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_absolute(path: str) -> str:
+    return os.path.normpath(path)
+
+
+def normalize_repo_path(path: str) -> str:
+    """
+    Return ``path`` as a normalised absolute path.
+
+    Absolute paths are memoized and never touch ``os.getcwd()``. Relative
+    paths depend on the current directory, so they are resolved on each call.
+    """
+    if os.path.isabs(path):
+        return _normalize_absolute(path)
+    return os.path.abspath(path)
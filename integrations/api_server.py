@@ -12,6 +12,8 @@ from fastapi.responses import JSONResponse
 import uvicorn
 from loguru import logger
 
+from integrations._paths import normalize_repo_path
+
 
 app = FastAPI(title="Afterburner API", version="0.1.0")
 main_loop: Optional[asyncio.AbstractEventLoop] = None
@@ -20,6 +22,10 @@ main_loop: Optional[asyncio.AbstractEventLoop] = None
 async def startup_event():
     global main_loop
     main_loop = asyncio.get_running_loop()
+    # Long-lived process: repeated runs on an unchanged tree can reuse the diff
+    from src.agents.change_detector import enable_diff_cache
+
+    enable_diff_cache()
 
 # ──────────────────────────── WebSocket Manager ────────────────────────────
 
@@ -261,7 +267,7 @@ async def _handle_run(data: dict):
         try:
             from src.graph.workflow import run_afterburner
             result = run_afterburner(
-                repo_path=os.path.abspath(repo_path),
+                repo_path=normalize_repo_path(repo_path),
                 trigger_source="extension",
                 skip_deploy=skip_deploy,
                 on_node_complete=on_node_complete,
@@ -290,7 +296,7 @@ async def _handle_run(data: dict):
 
 async def _handle_security(data: dict):
     """Handle security-only run."""
-    repo_path = os.path.abspath(data.get("repo_path", os.getcwd()))
+    repo_path = normalize_repo_path(data.get("repo_path", os.getcwd()))
 
     reset_state()
     current_state["status"] = "running"
@@ -322,7 +328,7 @@ async def _handle_security(data: dict):
 
 async def _handle_test(data: dict):
     """Handle test-only run."""
-    repo_path = os.path.abspath(data.get("repo_path", os.getcwd()))
+    repo_path = normalize_repo_path(data.get("repo_path", os.getcwd()))
 
     reset_state()
     current_state["status"] = "running"
@@ -354,7 +360,7 @@ async def _handle_test(data: dict):
 
 async def _handle_commit(data: dict):
     """Handle git commit-only run."""
-    repo_path = os.path.abspath(data.get("repo_path", os.getcwd()))
+    repo_path = normalize_repo_path(data.get("repo_path", os.getcwd()))
 
     reset_state()
     current_state["status"] = "running"
@@ -389,7 +395,7 @@ async def _handle_commit(data: dict):
 
 async def _handle_deploy(data: dict):
     """Handle deploy-only run."""
-    repo_path = os.path.abspath(data.get("repo_path", os.getcwd()))
+    repo_path = normalize_repo_path(data.get("repo_path", os.getcwd()))
 
     reset_state()
     current_state["status"] = "running"
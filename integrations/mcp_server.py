@@ -1,6 +1,9 @@
 """Afterburner MCP Server — Model Context Protocol stdio server for Cursor and Antigravity."""
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import json
 import os
 import sys
@@ -11,10 +14,19 @@ from mcp.types import Tool, TextContent
 
 from loguru import logger
 
+from integrations._paths import normalize_repo_path
+from src.utils.logging import setup_logging
+
+setup_logging()
+
 
 # Create MCP server instance
 server = Server("afterburner")
 
+# One pool for all blocking pipeline work, reused across tool calls
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="afterburner")
+atexit.register(_POOL.shutdown, wait=False)
+
 
 # ──────────────────────────── Tool Definitions ────────────────────────────
 
@@ -124,7 +136,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool invocations from the MCP client (Cursor/Antigravity)."""
 
     repo_path = arguments.get("repo_path", os.environ.get("AFTERBURNER_REPO_PATH", os.getcwd()))
-    repo_path = os.path.abspath(repo_path)
+    repo_path = normalize_repo_path(repo_path)
 
     try:
         if name == "run_afterburner":
@@ -157,7 +169,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         else:
             result = f"Unknown tool: {name}"
 
-        return [TextContent(type="text", text=str(result))]
+        text = result if isinstance(result, str) else str(result)
+        return [TextContent(type="text", text=text)]
 
     except Exception as e:
         logger.error("Tool '{}' failed: {}", name, str(e))
@@ -171,15 +184,12 @@ async def _run_full_pipeline(repo_path: str, skip_deploy: bool = False) -> str:
     """Run the full Afterburner pipeline and return Markdown summary."""
     from src.graph.workflow import run_afterburner
 
-    # Run synchronously in executor to avoid blocking
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(
-        None,
-        lambda: run_afterburner(
-            repo_path=repo_path,
-            trigger_source="mcp",
-            skip_deploy=skip_deploy,
-        ),
+    # Run on the worker pool to avoid blocking the event loop
+    result = await asyncio.to_thread(
+        run_afterburner,
+        repo_path=repo_path,
+        trigger_source="mcp",
+        skip_deploy=skip_deploy,
     )
 
     return result.get("final_summary", "Pipeline completed but no summary generated.")
@@ -187,24 +197,7 @@ async def _run_full_pipeline(repo_path: str, skip_deploy: bool = False) -> str:
 
 async def _run_security_only(repo_path: str) -> str:
     """Run security scan only."""
-    from src.utils.logging import setup_logging
-    from src.agents.change_detector import change_detector_node
-    from src.agents.security_sentinel import security_sentinel_node
-
-    setup_logging()
-
-    def _run():
-        state = {
-            "repo_path": repo_path,
-            "changed_files": [],
-            "trigger_source": "mcp",
-            "reflection_count": 0,
-        }
-        state.update(change_detector_node(state))
-        return security_sentinel_node(state)
-
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, _run)
+    result = await asyncio.to_thread(_sync_security, repo_path)
 
     passed = result.get("security_passed", True)
     count = result.get("security_issues_count", 0)
@@ -215,24 +208,7 @@ async def _run_security_only(repo_path: str) -> str:
 
 async def _run_test_only(repo_path: str) -> str:
     """Run tests only."""
-    from src.utils.logging import setup_logging
-    from src.agents.change_detector import change_detector_node
-    from src.agents.test_pilot import test_pilot_node
-
-    setup_logging()
-
-    def _run():
-        state = {
-            "repo_path": repo_path,
-            "changed_files": [],
-            "trigger_source": "mcp",
-            "test_debug_iterations": 0,
-        }
-        state.update(change_detector_node(state))
-        return test_pilot_node(state)
-
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, _run)
+    result = await asyncio.to_thread(_sync_test, repo_path)
 
     passed = result.get("tests_passed", False)
     icon = "✅" if passed else "❌"
@@ -242,28 +218,10 @@ async def _run_test_only(repo_path: str) -> str:
 
 async def _run_git_only(repo_path: str, no_pr: bool = False) -> str:
     """Run git commit only."""
-    from src.utils.logging import setup_logging
-    from src.agents.change_detector import change_detector_node
-    from src.agents.git_guardian import git_guardian_node
-
-    setup_logging()
-
     if no_pr:
         os.environ["AFTERBURNER_AUTO_PR"] = "false"
 
-    def _run():
-        state = {
-            "repo_path": repo_path,
-            "changed_files": [],
-            "trigger_source": "mcp",
-            "security_passed": True,
-            "tests_passed": True,
-        }
-        state.update(change_detector_node(state))
-        return git_guardian_node(state)
-
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, _run)
+    result = await asyncio.to_thread(_sync_git, repo_path)
 
     sha = result.get("commit_sha", "unknown")
     pr = result.get("pr_url")
@@ -276,23 +234,10 @@ async def _run_git_only(repo_path: str, no_pr: bool = False) -> str:
 
 async def _run_deploy_only(repo_path: str, target: str = None) -> str:
     """Run deploy only."""
-    from src.utils.logging import setup_logging
-    from src.agents.launch_controller import launch_controller_node
-
-    setup_logging()
-
     if target:
         os.environ["AFTERBURNER_DEPLOY_TARGET"] = target
 
-    def _run():
-        state = {
-            "repo_path": repo_path,
-            "skip_deploy": False,
-        }
-        return launch_controller_node(state)
-
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, _run)
+    result = await asyncio.to_thread(_sync_deploy, repo_path)
 
     status = result.get("deployment_status", "unknown")
     url = result.get("deployment_url")
@@ -304,18 +249,102 @@ async def _run_deploy_only(repo_path: str, target: str = None) -> str:
     return msg
 
 
+# Blocking bodies of the single-stage tools, run on the worker pool
+
+
+def _sync_security(repo_path: str) -> dict:
+    from src.agents.change_detector import change_detector_node
+    from src.agents.security_sentinel import security_sentinel_node
+
+    state = {
+        "repo_path": repo_path,
+        "changed_files": [],
+        "trigger_source": "mcp",
+        "reflection_count": 0,
+    }
+    state.update(change_detector_node(state))
+    return security_sentinel_node(state)
+
+
+def _sync_test(repo_path: str) -> dict:
+    from src.agents.change_detector import change_detector_node
+    from src.agents.test_pilot import test_pilot_node
+
+    state = {
+        "repo_path": repo_path,
+        "changed_files": [],
+        "trigger_source": "mcp",
+        "test_debug_iterations": 0,
+    }
+    state.update(change_detector_node(state))
+    return test_pilot_node(state)
+
+
+def _sync_git(repo_path: str) -> dict:
+    from src.agents.change_detector import change_detector_node
+    from src.agents.git_guardian import git_guardian_node
+
+    state = {
+        "repo_path": repo_path,
+        "changed_files": [],
+        "trigger_source": "mcp",
+        "security_passed": True,
+        "tests_passed": True,
+    }
+    state.update(change_detector_node(state))
+    return git_guardian_node(state)
+
+
+def _sync_deploy(repo_path: str) -> dict:
+    from src.agents.launch_controller import launch_controller_node
+
+    state = {
+        "repo_path": repo_path,
+        "skip_deploy": False,
+    }
+    return launch_controller_node(state)
+
+
 def _get_status() -> str:
     """Return current configuration as formatted string."""
     from src.config import settings
 
+    return _status_str((
+        settings.LLM_PROVIDER,
+        settings.LLM_MODEL,
+        settings.GITHUB_REPO,
+        settings.AUTO_PR,
+        settings.ENABLE_SEMGREP,
+        settings.ENABLE_BANDIT,
+        settings.DEPLOY_TARGET,
+        settings.MAX_TEST_DEBUG_ITERATIONS,
+        settings.MAX_REFLECTION_RETRIES,
+    ))
+
+
+@functools.lru_cache(maxsize=1)
+def _status_str(fingerprint: tuple) -> str:
+    """Render the status text for one settings snapshot (re-rendered only when it changes)."""
+    (
+        llm_provider,
+        llm_model,
+        github_repo,
+        auto_pr,
+        enable_semgrep,
+        enable_bandit,
+        deploy_target,
+        max_test_iterations,
+        max_reflection_retries,
+    ) = fingerprint
+
     return (
         "🔥 Afterburner Configuration\n"
-        f"- LLM: {settings.LLM_PROVIDER} ({settings.LLM_MODEL})\n"
-        f"- GitHub: {settings.GITHUB_REPO or 'Not configured'}\n"
-        f"- Auto PR: {settings.AUTO_PR}\n"
-        f"- Security: Semgrep={settings.ENABLE_SEMGREP}, Bandit={settings.ENABLE_BANDIT}\n"
-        f"- Deploy: {settings.DEPLOY_TARGET or 'None'}\n"
-        f"- Max retries: test={settings.MAX_TEST_DEBUG_ITERATIONS}, reflection={settings.MAX_REFLECTION_RETRIES}\n"
+        f"- LLM: {llm_provider} ({llm_model})\n"
+        f"- GitHub: {github_repo or 'Not configured'}\n"
+        f"- Auto PR: {auto_pr}\n"
+        f"- Security: Semgrep={enable_semgrep}, Bandit={enable_bandit}\n"
+        f"- Deploy: {deploy_target or 'None'}\n"
+        f"- Max retries: test={max_test_iterations}, reflection={max_reflection_retries}\n"
     )
 
 
@@ -325,6 +354,12 @@ def _get_status() -> str:
 async def main():
     """Run the MCP stdio server."""
     logger.info("Starting Afterburner MCP server...")
+    # asyncio.to_thread() runs on the loop's default executor — make that the shared pool
+    asyncio.get_running_loop().set_default_executor(_POOL)
+    # Long-lived process: repeated runs on an unchanged tree can reuse the diff
+    from src.agents.change_detector import enable_diff_cache
+
+    enable_diff_cache()
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
@@ -1,10 +1,18 @@
-"""Agents package — LangGraph node functions for the Afterburner pipeline."""
+"""Agents package — LangGraph node functions for the Afterburner pipeline.
 
-from .change_detector import change_detector_node
-from .security_sentinel import security_sentinel_node
-from .test_pilot import test_pilot_node
-from .git_guardian import git_guardian_node
-from .launch_controller import launch_controller_node
+Nodes are resolved lazily (PEP 562) so importing one agent does not pull in
+the dependencies of all the others.
+"""
+
+import importlib
+
+_AGENTS = {
+    "change_detector_node": ".change_detector",
+    "security_sentinel_node": ".security_sentinel",
+    "test_pilot_node": ".test_pilot",
+    "git_guardian_node": ".git_guardian",
+    "launch_controller_node": ".launch_controller",
+}
 
 __all__ = [
     "change_detector_node",
@@ -13,3 +21,16 @@ __all__ = [
     "git_guardian_node",
     "launch_controller_node",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _AGENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_AGENTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
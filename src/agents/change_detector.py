@@ -1,8 +1,33 @@
 """Change Detector — detects what files changed via git diff and classifies them."""
 
+import concurrent.futures
+from typing import Dict, List, Tuple
+
 from loguru import logger
 from src.graph.state import AfterburnerState
-from src.tools.git_tools import get_changed_files, get_diff_summary, classify_file_types
+from src.tools.git_tools import (
+    get_changed_files,
+    get_diff_summary,
+    classify_file_types,
+    summarize_file_types,
+    get_worktree_fingerprint,
+)
+
+
+# (repo_path, head_sha, worktree_digest) → (changed_files, diff_summary, file_types)
+# Lets back-to-back runs in one process (MCP / API server) skip the git diffs
+# while the working tree is unchanged. Only the latest snapshot per repo is kept.
+_DIFF_CACHE: Dict[Tuple[str, str, str], Tuple[List[str], str, Dict[str, List[str]]]] = {}
+
+# Off by default: a one-shot CLI run would pay for the worktree fingerprint
+# (rev-parse, a full git status and a stat per entry) without ever getting a hit.
+_DIFF_CACHE_ENABLED = False
+
+
+def enable_diff_cache() -> None:
+    """Turn on _DIFF_CACHE — called by the long-lived servers at startup."""
+    global _DIFF_CACHE_ENABLED
+    _DIFF_CACHE_ENABLED = True
 
 
 def change_detector_node(state: AfterburnerState) -> dict:
@@ -12,31 +37,67 @@ def change_detector_node(state: AfterburnerState) -> dict:
     Reads `repo_path` from state, runs git diff, and classifies file types
     for downstream agent routing (e.g. skip Bandit if no Python files).
 
+    If state already carries changed_files, diff_summary and file_types the
+    node returns immediately without running git.
+
     Returns state updates for:
-        - changed_files
+        - changed_files (omitted on the short-circuit path)
         - diff_summary
         - file_types
         - current_stage
     """
     repo_path = state["repo_path"]
-    logger.info("🔍 Detecting changes in {}", repo_path)
 
-    # Get changed files — falls back to staged/untracked
-    changed_files = state.get("changed_files", [])
-    if not changed_files:
-        changed_files = get_changed_files(repo_path)
-
-    if not changed_files:
-        logger.warning("No changed files detected — pipeline may produce empty results")
+    # Re-entry with everything already computed — nothing to redo.
+    # changed_files is left out of the update: its merge_lists reducer would
+    # append a second copy of the list already in state.
+    changed_files = state.get("changed_files")
+    diff_summary = state.get("diff_summary")
+    file_types = state.get("file_types")
+    if changed_files and diff_summary and file_types:
+        logger.debug("Change detection already done for {} — reusing state", repo_path)
         return {
-            "changed_files": [],
-            "diff_summary": "No changes detected",
-            "file_types": {},
+            "diff_summary": diff_summary,
+            "file_types": file_types,
             "current_stage": "change_detection_complete",
         }
 
-    # Get human-readable diff summary
-    diff_summary = get_diff_summary(repo_path)
+    logger.info("🔍 Detecting changes in {}", repo_path)
+
+    # Get changed files — falls back to staged/untracked
+    changed_files = changed_files or []
+    cache_key = None
+    if not changed_files and _DIFF_CACHE_ENABLED:
+        cache_key = (repo_path, *get_worktree_fingerprint(repo_path))
+        cached = _DIFF_CACHE.get(cache_key)
+        if cached is not None:
+            cached_files, diff_summary, file_types = cached
+            logger.info("Working tree unchanged — reusing cached diff ({} files)", len(cached_files))
+            return {
+                "changed_files": list(cached_files),
+                "diff_summary": diff_summary,
+                "file_types": {k: list(v) for k, v in file_types.items()},
+                "current_stage": "change_detection_complete",
+            }
+
+    # The --stat summary doesn't depend on the file list, so both git
+    # processes run side by side instead of back to back.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        summary_future = executor.submit(get_diff_summary, repo_path)
+        if not changed_files:
+            changed_files = get_changed_files(repo_path)
+
+        if not changed_files:
+            logger.warning("No changed files detected — pipeline may produce empty results")
+            return {
+                "changed_files": [],
+                "diff_summary": "No changes detected",
+                "file_types": {},
+                "current_stage": "change_detection_complete",
+            }
+
+        # Get human-readable diff summary
+        diff_summary = summary_future.result()
 
     # Classify file types for agent routing
     file_types = classify_file_types(changed_files)
@@ -44,9 +105,18 @@ def change_detector_node(state: AfterburnerState) -> dict:
     logger.info(
         "Detected {} changed files: {}",
         len(changed_files),
-        ", ".join(f"{k}({len(v)})" for k, v in file_types.items()),
+        summarize_file_types(file_types),
     )
 
+    if cache_key is not None:
+        for stale in [k for k in _DIFF_CACHE if k[0] == repo_path]:
+            del _DIFF_CACHE[stale]
+        _DIFF_CACHE[cache_key] = (
+            list(changed_files),
+            diff_summary,
+            {k: list(v) for k, v in file_types.items()},
+        )
+
     return {
         "changed_files": changed_files,
         "diff_summary": diff_summary,
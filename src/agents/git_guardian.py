@@ -1,19 +1,26 @@
 """Git Guardian — creates clean commits, branches, and Pull Requests."""
 
-from datetime import datetime
+import concurrent.futures
+import functools
+import re
+import threading
+import time
 from typing import Optional
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from loguru import logger
 
 from src.config import settings
-from src.graph.state import AfterburnerState
-from src.models.reports import SecurityReport
+from src.graph.state import AfterburnerState, get_security_report
 from src.tools.git_tools import create_branch, commit, push
 from src.tools.github_tools import create_pr, get_codeowners, generate_pr_body
-from src.utils.llm import get_llm
 
 
+# Collapses anything that isn't safe in a branch name into a single dash
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# Give up on the LLM after this long and use the fallback commit message
+COMMIT_MSG_TIMEOUT_SECONDS = 10
+
 COMMIT_MSG_PROMPT = """You are a senior developer writing a git commit message.
 
 Rules:
@@ -52,7 +59,7 @@ def git_guardian_node(state: AfterburnerState) -> dict:
     diff_summary = state.get("diff_summary", "")
     security_passed = state.get("security_passed", True)
     tests_passed = state.get("tests_passed", True)
-    security_report_data = state.get("security_report")
+    security_report_data = get_security_report(state)
     test_results = state.get("test_results", [])
 
     logger.info("📦 Git Guardian: preparing commit and PR")
@@ -66,12 +73,12 @@ def git_guardian_node(state: AfterburnerState) -> dict:
     )
 
     # Create branch if on a protected branch
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    import re
+    # Sub-second suffix keeps back-to-back runs from colliding on the same branch
+    timestamp = time.strftime("%Y%m%d-%H%M%S") + f"-{time.monotonic_ns() & 0xFFFF:04x}"
     first_line = commit_message.split("\n")[0]
     commit_type = first_line.split("(")[0].split(":")[0] if ":" in first_line else "feat"
     short_desc = first_line.split(":")[-1].strip()[:30].lower()
-    short_desc = re.sub(r'[^a-zA-Z0-9]+', '-', short_desc).strip('-')
+    short_desc = _SLUG_RE.sub("-", short_desc).strip("-")
     branch_name = f"afterburner/{commit_type}/{short_desc}-{timestamp}"
 
     try:
@@ -141,6 +148,22 @@ def git_guardian_node(state: AfterburnerState) -> dict:
     return update
 
 
+@functools.lru_cache(maxsize=16)
+def _build_prompt(
+    diff_summary: str,
+    changed_files: tuple,
+    security_passed: bool,
+    tests_passed: bool,
+) -> str:
+    """Render COMMIT_MSG_PROMPT; callers pass the already-truncated inputs as the cache key."""
+    return COMMIT_MSG_PROMPT.format(
+        diff_summary=diff_summary,
+        changed_files=", ".join(changed_files),
+        security_status="✅ passed" if security_passed else "⚠️ issues found",
+        test_status="✅ all passed" if tests_passed else "⚠️ some failures",
+    )
+
+
 def _generate_commit_message(
     diff_summary: str,
     changed_files: list,
@@ -148,23 +171,47 @@ def _generate_commit_message(
     tests_passed: bool,
 ) -> str:
     """Generate a Conventional Commits message via LLM."""
+    # Deferred: LangChain and the provider SDKs are only needed on this path
+    from langchain_core.messages import HumanMessage, SystemMessage
+    from src.utils.llm import get_llm
+
     try:
         llm = get_llm(temperature=0.2)
 
-        response = llm.invoke([
+        messages = [
             SystemMessage(content="You write concise, conventional git commit messages."),
-            HumanMessage(content=COMMIT_MSG_PROMPT.format(
-                diff_summary=diff_summary[:500],
-                changed_files=", ".join(changed_files[:15]),
-                security_status="✅ passed" if security_passed else "⚠️ issues found",
-                test_status="✅ all passed" if tests_passed else "⚠️ some failures",
+            HumanMessage(content=_build_prompt(
+                diff_summary[:500],
+                tuple(changed_files[:15]),
+                security_passed,
+                tests_passed,
             )),
-        ])
+        ]
+
+        result: concurrent.futures.Future = concurrent.futures.Future()
+
+        def _collect() -> None:
+            try:
+                result.set_result("".join(chunk.content for chunk in llm.stream(messages)))
+            except BaseException as e:
+                result.set_exception(e)
 
-        msg = response.content.strip().strip("`").strip()
+        # Stream on a daemon thread so a hanging provider can't stall the
+        # commit path — or interpreter exit, which joins executor workers.
+        threading.Thread(target=_collect, name="commit-msg-llm", daemon=True).start()
+        content = result.result(timeout=COMMIT_MSG_TIMEOUT_SECONDS)
+
+        msg = content.strip().strip("`").strip()
         logger.debug("Generated commit message: {}", msg.split("\n")[0])
         return msg
 
+    except concurrent.futures.TimeoutError:
+        logger.warning(
+            "LLM commit message timed out after {}s, using fallback",
+            COMMIT_MSG_TIMEOUT_SECONDS,
+        )
+        return f"chore: afterburner automated commit ({len(changed_files)} files changed)"
+
     except Exception as e:
         logger.warning("LLM commit message failed, using fallback: {}", str(e))
         return f"chore: afterburner automated commit ({len(changed_files)} files changed)"
@@ -174,18 +221,29 @@ def _format_security_details(security_report_data: Optional[dict]) -> str:
     """Format security report for PR body."""
     if not security_report_data:
         return "No security scan performed."
+    if security_report_data.get("unavailable"):
+        return "Security report unavailable (expired from the blob store)."
+
+    # Already validated by security_sentinel_node — read the dict directly
+    # instead of rebuilding a SecurityReport for every finding.
+    counts = {"critical": 0, "warning": 0, "info": 0}
+    critical = []
+    for f in security_report_data.get("findings", []):
+        severity = f.get("severity")
+        if severity in counts:
+            counts[severity] += 1
+        if severity == "critical":
+            critical.append(f)
 
-    report = SecurityReport(**security_report_data)
     lines = []
-    lines.append(f"- **Critical**: {report.critical_count}")
-    lines.append(f"- **Warnings**: {report.warning_count}")
-    lines.append(f"- **Info**: {report.info_count}")
+    lines.append(f"- **Critical**: {counts['critical']}")
+    lines.append(f"- **Warnings**: {counts['warning']}")
+    lines.append(f"- **Info**: {counts['info']}")
 
-    if report.critical_count > 0:
+    if critical:
         lines.append("\n**Critical Findings:**")
-        for f in report.findings:
-            if f.severity == "critical":
-                lines.append(f"- `{f.file}:{f.line}` — {f.message}")
+        for f in critical:
+            lines.append(f"- `{f.get('file')}:{f.get('line')}` — {f.get('message')}")
 
     return "\n".join(lines)
 
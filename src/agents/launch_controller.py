@@ -1,12 +1,14 @@
 """Launch Controller — CI/CD generation, deployment, and monitoring setup."""
 
+import concurrent.futures
+
 from loguru import logger
 
 from src.config import settings
-from src.graph.state import AfterburnerState
-from src.models.reports import DeployResult, AfterburnerReport
+from src.graph.state import AfterburnerState, get_security_report
+from src.models.reports import DeployResult, render_markdown
 from src.tools.deploy_tools import deploy_vercel, deploy_docker_compose, generate_github_actions_workflow
-from src.tools.monitoring_tools import setup_sentry, generate_prometheus_config, verify_health
+from src.tools.monitoring_tools import setup_sentry, generate_prometheus_config, run_health_check
 
 
 def launch_controller_node(state: AfterburnerState) -> dict:
@@ -21,10 +23,12 @@ def launch_controller_node(state: AfterburnerState) -> dict:
     5. Health check on deployed URL
 
     Respects skip_deploy flag — only generates CI config and skips deploy.
+    The deploy runs on a worker thread, overlapping steps 1, 3 and 4.
 
     Returns state updates for:
         - deployment_url
         - deployment_status
+        - deployment_health
         - monitoring_configured
         - current_stage
     """
@@ -33,52 +37,65 @@ def launch_controller_node(state: AfterburnerState) -> dict:
 
     logger.info("🚀 Launch Controller: CI/CD + Deploy + Monitoring")
 
-    # Generate CI/CD config
-    if not skip_deploy:
-        try:
-            ci_path = generate_github_actions_workflow(repo_path)
-            logger.info("CI/CD workflow: {}", ci_path)
-        except Exception as e:
-            logger.warning("CI/CD generation failed: {}", str(e))
-    else:
-        logger.info("Skipping CI/CD workflow generation (skip_deploy=True)")
-
-    # Deploy
-    deploy_result = None
+    # Deploy — the only slow step, so it runs on a worker while the CI and
+    # monitoring config (small file writes that don't depend on it) are
+    # generated on this thread.
     deploy_target = settings.DEPLOY_TARGET
+    executor = None
+    deploy_future = None
+    deploy_result = None
 
     if skip_deploy or not deploy_target:
         logger.info("Deployment skipped (skip_deploy={}, target={})", skip_deploy, deploy_target)
         deploy_result = DeployResult(target="none", status="skipped")
-    elif deploy_target == "vercel":
-        deploy_result = deploy_vercel(repo_path, token=settings.VERCEL_TOKEN)
-    elif deploy_target == "docker":
-        deploy_result = deploy_docker_compose(repo_path)
+    elif deploy_target in ("vercel", "docker"):
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        if deploy_target == "vercel":
+            deploy_future = executor.submit(deploy_vercel, repo_path, token=settings.VERCEL_TOKEN)
+        else:
+            deploy_future = executor.submit(deploy_docker_compose, repo_path)
     else:
         logger.warning("Unknown deploy target '{}' — skipping", deploy_target)
         deploy_result = DeployResult(target=deploy_target, status="skipped")
 
-    # Monitoring
-    monitoring_configured = False
+    try:
+        # Generate CI/CD config
+        if not skip_deploy:
+            try:
+                ci_path = generate_github_actions_workflow(repo_path)
+                logger.info("CI/CD workflow: {}", ci_path)
+            except Exception as e:
+                logger.warning("CI/CD generation failed: {}", str(e))
+        else:
+            logger.info("Skipping CI/CD workflow generation (skip_deploy=True)")
+
+        # Monitoring
+        monitoring_configured = False
+
+        if settings.SENTRY_DSN:
+            monitoring_configured = setup_sentry(repo_path, settings.SENTRY_DSN)
 
-    if settings.SENTRY_DSN:
-        monitoring_configured = setup_sentry(repo_path, settings.SENTRY_DSN)
+        if settings.ENABLE_PROMETHEUS:
+            generate_prometheus_config(repo_path)
+            monitoring_configured = True
 
-    if settings.ENABLE_PROMETHEUS:
-        generate_prometheus_config(repo_path)
-        monitoring_configured = True
+        if deploy_future is not None:
+            deploy_result = deploy_future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
-    # Health check on deployed URL
+    # Health check on deployed URL — bounded, concurrent probes with retry
+    health = None
     if deploy_result and deploy_result.url and deploy_result.status == "success":
-        health = verify_health(deploy_result.url)
-        if health["healthy"]:
-            logger.info("Health check passed: {} ({}ms)", health["url"], health["response_time_ms"])
-        else:
+        health = run_health_check(deploy_result.url)
+        if not health["healthy"]:
             logger.warning("Health check failed: {}", health.get("error"))
 
     return {
         "deployment_url": deploy_result.url if deploy_result else None,
         "deployment_status": deploy_result.status if deploy_result else "skipped",
+        "deployment_health": health,
         "monitoring_configured": monitoring_configured,
         "current_stage": "deployment_complete",
     }
@@ -97,47 +114,22 @@ def summarize_node(state: AfterburnerState) -> dict:
     """
     logger.info("📋 Generating final summary...")
 
-    # Reconstruct report from state
-    from src.models.reports import SecurityReport
-
-    security_report = None
-    if state.get("security_report"):
-        try:
-            security_report = SecurityReport(**state["security_report"])
-        except Exception:
-            pass
-
-    deploy_result = None
+    # Render straight from the state dicts — they were validated when produced
+    deployment = None
     if state.get("deployment_status"):
-        deploy_result = DeployResult(
-            target=settings.DEPLOY_TARGET or "none",
-            url=state.get("deployment_url"),
-            status=state.get("deployment_status", "skipped"),
-        )
-
-    # Build test runs
-    from src.models.reports import TestRun
-    test_runs = []
-    for tr_data in state.get("test_results", []):
-        try:
-            test_runs.append(TestRun(**tr_data))
-        except Exception:
-            pass
-
-    report = AfterburnerReport(
-        changed_files=state.get("changed_files", []),
-        diff_summary=state.get("diff_summary", ""),
-        security_report=security_report,
-        test_results=test_runs,
-        branch_name=state.get("branch_name"),
-        commit_sha=state.get("commit_sha"),
-        pr_url=state.get("pr_url"),
-        deployment=deploy_result,
-        hard_fail=state.get("hard_fail", False),
-        errors=state.get("errors", []),
+        deployment = {
+            "target": settings.DEPLOY_TARGET or "none",
+            "url": state.get("deployment_url"),
+            "status": state.get("deployment_status", "skipped"),
+            "health": state.get("deployment_health"),
+        }
+
+    summary = render_markdown(
+        get_security_report(state),
+        state.get("test_results", []),
+        deployment,
+        state,
     )
-
-    summary = report.to_markdown()
     logger.info("Summary generated ({} chars)", len(summary))
 
     return {
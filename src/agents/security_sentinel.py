@@ -1,24 +1,30 @@
 """Security Sentinel — runs static analysis tools and triages findings via LLM."""
 
+import concurrent.futures
+import dataclasses
 import time
 from typing import List
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from loguru import logger
+from pydantic import TypeAdapter
 
 from src.config import settings
 from src.graph.state import AfterburnerState
-from src.models.reports import SecurityFinding, SecurityReport
+from src.utils.blobs import put_blob
+from src.tools.git_tools import classify_file_types
+from src.models.reports import SecurityFinding, SecurityReport, TriageItem
 from src.tools.security_tools import (
-    run_semgrep,
-    run_bandit,
-    run_npm_audit,
-    run_cargo_audit,
     aggregate_security_findings,
+    plan_security_scans,
+    run_scan,
 )
-from src.utils.llm import get_llm
+from src.utils.text import head_join
 
 
+# Findings per triage call, and how many triage calls may run at once
+TRIAGE_BATCH_SIZE = 25
+TRIAGE_MAX_PARALLEL = 4
+
 SECURITY_TRIAGE_PROMPT = """You are a senior security engineer triaging static analysis findings.
 
 Given the following security scan results, classify each finding as:
@@ -34,6 +40,13 @@ Findings:
 {findings}
 """
 
+# Built once — TypeAdapter construction compiles the validator
+_TRIAGE_ADAPTER = TypeAdapter(List[TriageItem])
+
+# Split once at import. The prompt contains literal JSON braces, so
+# str.format() would raise KeyError on it; concatenation needs no parsing.
+_TRIAGE_PREFIX, _TRIAGE_SUFFIX = SECURITY_TRIAGE_PROMPT.split("{findings}")
+
 
 def security_sentinel_node(state: AfterburnerState) -> dict:
     """
@@ -43,7 +56,7 @@ def security_sentinel_node(state: AfterburnerState) -> dict:
     Uses LLM to re-classify finding severities for more accurate gating.
 
     Returns state updates for:
-        - security_report
+        - security_report_ref (or security_report if the blob store is unavailable)
         - security_passed
         - security_issues_count
         - current_stage
@@ -51,76 +64,106 @@ def security_sentinel_node(state: AfterburnerState) -> dict:
     """
     repo_path = state["repo_path"]
     changed_files = state.get("changed_files", [])
-    file_types = state.get("file_types", {})
+    file_types = state.get("file_types")
     reflection_count = state.get("reflection_count", 0)
 
     logger.info("🛡️ Running security analysis (attempt {})", reflection_count + 1)
 
+    # Normally set by change_detector_node; derive it once if this node runs standalone
+    derived_file_types = file_types is None
+    if derived_file_types:
+        file_types = classify_file_types(changed_files)
+
     start_time = time.time()
     all_findings: List[SecurityFinding] = []
+    incomplete_scans: List[str] = []
+
+    # Scanners are independent subprocesses — run them side by side so the
+    # stage takes as long as the slowest tool rather than the sum of all.
+    scans = plan_security_scans(repo_path, changed_files, file_types)
+
+    if scans:
+        # Triage overlaps with the scanners still running: as each scanner
+        # finishes, its findings are sent to the LLM in batches on the same pool.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(scans) + TRIAGE_MAX_PARALLEL
+        ) as executor:
+            scan_futures = {
+                executor.submit(run_scan, job, repo_path): i
+                for i, job in enumerate(scans)
+            }
+            triage_futures = []  # (scan index, batch start, future)
+            for future in concurrent.futures.as_completed(scan_futures):
+                findings, complete = future.result()
+                if not complete:
+                    incomplete_scans.append(scans[scan_futures[future]][0])
+                for start in range(0, len(findings), TRIAGE_BATCH_SIZE):
+                    batch = findings[start:start + TRIAGE_BATCH_SIZE]
+                    triage_futures.append(
+                        (scan_futures[future], start, executor.submit(_llm_triage, batch))
+                    )
 
-    # Run Semgrep (language-agnostic)
-    if settings.ENABLE_SEMGREP:
-        logger.debug("Running Semgrep...")
-        findings = run_semgrep(repo_path, changed_files)
-        all_findings.extend(findings)
-        logger.info("Semgrep: {} findings", len(findings))
-
-    # Run Bandit (Python only)
-    if settings.ENABLE_BANDIT and "python" in file_types:
-        logger.debug("Running Bandit...")
-        findings = run_bandit(repo_path, file_types["python"])
-        all_findings.extend(findings)
-        logger.info("Bandit: {} findings", len(findings))
-
-    # Run npm audit (Node.js projects)
-    if "javascript" in file_types or "typescript" in file_types:
-        logger.debug("Running npm audit...")
-        findings = run_npm_audit(repo_path)
-        all_findings.extend(findings)
-        logger.info("npm audit: {} findings", len(findings))
-
-    # Run cargo audit (Rust projects)
-    if "rust" in file_types:
-        logger.debug("Running cargo audit...")
-        findings = run_cargo_audit(repo_path)
-        all_findings.extend(findings)
-        logger.info("cargo audit: {} findings", len(findings))
-
-    # LLM triage — re-classify severities if we have findings
-    if all_findings:
-        all_findings = _llm_triage(all_findings)
+        # Reassemble in scanner/batch order so the report is stable run to run
+        triage_futures.sort(key=lambda item: (item[0], item[1]))
+        for _, _, future in triage_futures:
+            all_findings.extend(future.result())
 
     # Aggregate into report
     elapsed_ms = (time.time() - start_time) * 1000
-    report = aggregate_security_findings(all_findings, block_on=settings.SECURITY_BLOCK_ON)
+    report = aggregate_security_findings(
+        all_findings,
+        block_on=settings.SECURITY_BLOCK_ON,
+        incomplete_scans=sorted(incomplete_scans),
+    )
     report.scan_duration_ms = elapsed_ms
+    critical_count = report.critical_count
 
     logger.info(
         "Security scan complete: {} findings ({} critical, {} warning) — {}",
         len(report.findings),
-        report.critical_count,
+        critical_count,
         report.warning_count,
         "PASSED" if report.passed else "BLOCKED",
     )
 
     update = {
-        "security_report": report.model_dump(),
         "security_passed": report.passed,
         "security_issues_count": len(report.findings),
         "current_stage": "security_review_complete",
     }
+    # Large report goes to the blob store; state (and checkpoints) keep only the ref
+    report_data = report.model_dump()
+    try:
+        update["security_report_ref"] = put_blob("security_report", report_data)
+        update["security_report"] = None
+    except OSError as e:
+        logger.debug("Blob store unavailable, keeping report inline: {}", str(e))
+        update["security_report"] = report_data
+    if derived_file_types:
+        # Keep it in state so reflection retries don't classify again
+        update["file_types"] = file_types
 
     # Increment reflection count if failed
     if not report.passed:
+        from langchain_core.messages import HumanMessage
+
         update["reflection_count"] = reflection_count + 1
-        # Add diagnostic context for the reflection loop
+        # Add diagnostic context for the reflection loop. head_join pulls from
+        # the generator lazily, so formatting stops once 1000 chars are built.
+        incomplete = (
+            f" Incomplete scans: {', '.join(report.incomplete_scans)}."
+            if report.incomplete_scans else ""
+        )
         update["messages"] = [HumanMessage(content=(
-            f"Security scan FAILED with {report.critical_count} critical findings. "
-            f"Top issues:\n" + "\n".join(
-                f"- [{f.tool}] {f.file}:{f.line} — {f.message}"
-                for f in report.findings if f.severity == "critical"
-            )[:1000]
+            f"Security scan FAILED with {critical_count} critical findings.{incomplete} "
+            f"Top issues:\n" + head_join(
+                (
+                    f"- [{f.tool}] {f.file}:{f.line} — {f.message}"
+                    for f in report.critical_findings
+                ),
+                "\n",
+                1000,
+            )
         ))]
 
     return update
@@ -132,6 +175,10 @@ def _llm_triage(findings: List[SecurityFinding]) -> List[SecurityFinding]:
 
     Falls back to original severities if LLM call fails.
     """
+    # Deferred: LangChain and the provider SDKs are only needed on this path
+    from langchain_core.messages import HumanMessage, SystemMessage
+    from src.utils.llm import get_llm
+
     try:
         llm = get_llm(temperature=0.0)
 
@@ -142,25 +189,23 @@ def _llm_triage(findings: List[SecurityFinding]) -> List[SecurityFinding]:
 
         response = llm.invoke([
             SystemMessage(content="You are a security triage expert."),
-            HumanMessage(content=SECURITY_TRIAGE_PROMPT.format(findings=findings_text)),
+            HumanMessage(content=_TRIAGE_PREFIX + findings_text + _TRIAGE_SUFFIX),
         ])
 
-        import json
-        triaged = json.loads(response.content)
+        # Parsed and validated in one pass; the Literal rejects unknown severities
+        triaged = _TRIAGE_ADAPTER.validate_json(response.content)
 
         for item in triaged:
-            idx = item.get("index")
-            new_severity = item.get("severity")
-            if idx is not None and 0 <= idx < len(findings) and new_severity in {"critical", "warning", "info"}:
-                if findings[idx].severity != new_severity:
-                    logger.debug(
-                        "LLM re-classified finding {} from {} to {}: {}",
-                        idx,
-                        findings[idx].severity,
-                        new_severity,
-                        item.get("reason", ""),
-                    )
-                    findings[idx].severity = new_severity
+            idx = item.index
+            if 0 <= idx < len(findings) and findings[idx].severity != item.severity:
+                logger.debug(
+                    "LLM re-classified finding {} from {} to {}: {}",
+                    idx,
+                    findings[idx].severity,
+                    item.severity,
+                    item.reason,
+                )
+                findings[idx] = dataclasses.replace(findings[idx], severity=item.severity)
 
     except Exception as e:
         logger.warning("LLM triage failed, using original severities: {}", str(e))
@@ -1,8 +1,10 @@
 """Test Pilot — runs tests, detects failures, and self-debug loops via LLM."""
 
-from typing import Dict, Any, List
+import concurrent.futures
+import functools
+import string
+from typing import Callable, Dict, Any, List
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from loguru import logger
 
 from src.config import settings
@@ -15,7 +17,7 @@ from src.tools.test_tools import (
     run_cargo_test,
     run_playwright,
 )
-from src.utils.llm import get_llm
+from src.utils.text import head_join
 
 
 SELF_DEBUG_PROMPT = """You are a senior software engineer debugging test failures.
@@ -37,6 +39,13 @@ Test errors:
 {errors}
 """
 
+# Compiled once; substitute() fills the three placeholders without re-parsing
+_SELF_DEBUG_TEMPLATE = string.Template(
+    SELF_DEBUG_PROMPT.replace("{test_output}", "$test_output")
+    .replace("{changed_files}", "$changed_files")
+    .replace("{errors}", "$errors")
+)
+
 
 def test_pilot_node(state: AfterburnerState) -> dict:
     """
@@ -51,70 +60,63 @@ def test_pilot_node(state: AfterburnerState) -> dict:
         - test_results
         - tests_passed
         - test_debug_iterations
+        - detected_frameworks
         - current_stage
     """
     repo_path = state["repo_path"]
     changed_files = state.get("changed_files", [])
-    file_types = state.get("file_types", {})
     iteration = state.get("test_debug_iterations", 0)
 
     logger.info("🧪 Running tests (iteration {})", iteration + 1)
 
-    # Detect available frameworks
-    frameworks = detect_test_framework(repo_path)
+    # Detect available frameworks once; self-debug retries reuse the result
+    frameworks = state.get("detected_frameworks")
+    if frameworks is None:
+        frameworks = detect_test_framework(repo_path)
 
     if not frameworks:
         logger.info("No test frameworks detected — skipping")
         return {
             "test_results": [],
             "tests_passed": True,
+            "detected_frameworks": [],
             "current_stage": "testing_complete",
         }
 
-    # Run each detected framework
-    results: List[Dict[str, Any]] = []
-    all_passed = True
-
+    # Build one job per runnable framework, then run them side by side —
+    # each is a subprocess, so the stage costs max(framework time), not the sum.
+    timeout = settings.TEST_TIMEOUT_SECONDS
+    jobs = []
     for framework in frameworks:
-        logger.info("Running {} tests...", framework)
-
         if framework == "pytest":
-            run_result = run_pytest(
-                repo_path, changed_files, timeout=settings.TEST_TIMEOUT_SECONDS
-            )
+            job = functools.partial(run_pytest, repo_path, changed_files, timeout=timeout)
         elif framework in ("vitest", "jest"):
-            run_result = run_vitest(
-                repo_path, changed_files, timeout=settings.TEST_TIMEOUT_SECONDS
-            )
+            job = functools.partial(run_vitest, repo_path, changed_files, timeout=timeout)
         elif framework == "cargo":
-            run_result = run_cargo_test(
-                repo_path, timeout=settings.TEST_TIMEOUT_SECONDS
-            )
+            job = functools.partial(run_cargo_test, repo_path, timeout=timeout)
         elif framework == "playwright" and settings.ENABLE_PLAYWRIGHT:
-            run_result = run_playwright(
-                repo_path, timeout=settings.TEST_TIMEOUT_SECONDS
-            )
+            job = functools.partial(run_playwright, repo_path, timeout=timeout)
         else:
             logger.debug("Skipping {} (not enabled or unsupported)", framework)
             continue
+        jobs.append((framework, job))
 
-        results.append(run_result.model_dump())
+    runs: List[TestRun] = []
+    if jobs:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(_run_framework, name, job) for name, job in jobs]
+        runs = [future.result() for future in futures]
 
-        if not run_result.all_passed:
-            all_passed = False
-            logger.warning(
-                "{}: {} passed, {} failed",
-                framework,
-                run_result.passed,
-                run_result.failed,
-            )
-        else:
-            logger.info("{}: {} passed ✅", framework, run_result.passed)
+    # Serialised once, here; fields still at their TestRun default are left
+    # out — every reader uses .get() with the same default.
+    results: List[Dict[str, Any]] = [run.model_dump(exclude_defaults=True) for run in runs]
+    all_passed = all(run.all_passed for run in runs)
 
     update: dict = {
         "test_results": results,
         "tests_passed": all_passed,
         "test_debug_iterations": iteration + 1,
+        "detected_frameworks": frameworks,
         "current_stage": "testing_complete",
     }
 
@@ -122,11 +124,31 @@ def test_pilot_node(state: AfterburnerState) -> dict:
     if not all_passed and iteration < settings.MAX_TEST_DEBUG_ITERATIONS:
         debug_msg = _generate_debug_suggestions(results, changed_files)
         if debug_msg:
+            from langchain_core.messages import HumanMessage
+
             update["messages"] = [HumanMessage(content=debug_msg)]
 
     return update
 
 
+def _run_framework(framework: str, job: Callable[[], TestRun]) -> TestRun:
+    """Run one framework's tests on a worker thread and log the outcome."""
+    logger.info("Running {} tests...", framework)
+    run_result = job()
+
+    if not run_result.all_passed:
+        logger.warning(
+            "{}: {} passed, {} failed",
+            framework,
+            run_result.passed,
+            run_result.failed,
+        )
+    else:
+        logger.info("{}: {} passed ✅", framework, run_result.passed)
+
+    return run_result
+
+
 def _generate_debug_suggestions(
     results: List[Dict[str, Any]],
     changed_files: List[str],
@@ -137,26 +159,26 @@ def _generate_debug_suggestions(
     Returns a human-readable debug suggestion string, or empty if LLM fails.
     """
     # Collect all errors from failed test runs
-    all_errors = []
-    all_output = []
-    for r in results:
-        if r.get("errors"):
-            all_errors.extend(r["errors"])
-        if r.get("output"):
-            all_output.append(r["output"][:500])
-
-    if not all_errors:
+    if not any(r.get("errors") for r in results):
         return ""
 
+    # Generators + head_join: only the prefix that fits the prompt is ever built
+    all_errors = (e for r in results for e in r.get("errors") or [])
+    all_output = (r["output"][:500] for r in results if r.get("output"))
+
+    # Deferred: LangChain and the provider SDKs are only needed on this path
+    from langchain_core.messages import HumanMessage, SystemMessage
+    from src.utils.llm import get_llm
+
     try:
         llm = get_llm(temperature=0.1)
 
         response = llm.invoke([
             SystemMessage(content="You are a test debugging expert."),
-            HumanMessage(content=SELF_DEBUG_PROMPT.format(
-                test_output="\n".join(all_output)[:2000],
+            HumanMessage(content=_SELF_DEBUG_TEMPLATE.substitute(
+                test_output=head_join(all_output, "\n", 2000),
                 changed_files=", ".join(changed_files[:20]),
-                errors="\n".join(all_errors)[:1000],
+                errors=head_join(all_errors, "\n", 1000),
             )),
         ])
 
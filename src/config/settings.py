@@ -42,6 +42,9 @@ class AfterburnerSettings(BaseSettings):
     SECURITY_BLOCK_ON: str = "critical"
     """Minimum severity that blocks the pipeline: 'critical' or 'warning'."""
 
+    SECURITY_FAIL_ON_INCOMPLETE_SCAN: bool = False
+    """Also block when a scanner timed out, crashed or produced unreadable output."""
+
     # ===== Testing =====
     MAX_TEST_DEBUG_ITERATIONS: int = 4
     """Maximum self-debug loop retries for failing tests."""
@@ -72,6 +75,22 @@ class AfterburnerSettings(BaseSettings):
     VERBOSE: bool = False
     """Enable verbose logging output."""
 
+    LOG_FILE: Optional[str] = None
+    """Optional path of a log file written in addition to stderr."""
+
+    # ===== Caching =====
+    CACHE_DIR: str = "~/.cache/afterburner"
+    """Directory for on-disk caches (kept outside the repo so it never shows up as a change)."""
+
+    ENABLE_SCAN_CACHE: bool = True
+    """Reuse security scan results while the scanned files are byte-for-byte unchanged."""
+
+    SCAN_CACHE_TTL_SECONDS: int = 86400
+    """Maximum age of a cached scan result, so advisory database updates are picked up."""
+
+    BLOB_TTL_SECONDS: int = 86400
+    """Blob-store entries not written within this long are deleted (see src/utils/blobs.py)."""
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_prefix="AFTERBURNER_",
@@ -1,19 +1,58 @@
 """AfterburnerState — shared state flowing through the LangGraph workflow."""
 
 from typing import TypedDict, List, Optional, Annotated, Dict, Any
-from langgraph.graph import add_messages
+
+from loguru import logger
 
 
 # ──────────────────────────── Custom Reducers ────────────────────────────
 
 
 def merge_lists(existing: List[str] | None, new: List[str] | None) -> List[str]:
-    """Concatenate two lists (used for changed_files, test_results, etc.)."""
-    if existing is None:
-        existing = []
-    if new is None:
-        new = []
-    return existing + new
+    """
+    Append new items that aren't already present (used for changed_files).
+
+    Order-preserving and duplicate-free, so nodes re-emitting the same files
+    on reflection retries don't grow the list — merge_lists(a, a) == a.
+    """
+    out = list(existing or [])
+    seen = set(out)
+    for item in new or []:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+    return out
+
+
+def merge_test_results(
+    existing: List[Dict[str, Any]] | None,
+    new: List[Dict[str, Any]] | None,
+) -> List[Dict[str, Any]]:
+    """
+    Merge serialised TestRun dicts, keeping only the latest run per framework.
+
+    A self-debug retry replaces that framework's previous result in place
+    instead of appending another copy.
+    """
+    merged: Dict[Any, Dict[str, Any]] = {}
+    for run in existing or []:
+        merged[run.get("framework")] = run
+    for run in new or []:
+        merged[run.get("framework")] = run
+    return list(merged.values())
+
+
+def add_messages(left: list, right: list) -> list:
+    """
+    LangGraph's add_messages reducer, imported on first use.
+
+    Importing langgraph costs most of a second; keeping it out of this
+    module lets agents (and the CLI commands that call them directly)
+    import the state schema without loading the graph runtime.
+    """
+    from langgraph.graph.message import add_messages as _add_messages
+
+    return _add_messages(left, right)
 
 
 def merge_errors(existing: List[str] | None, new: List[str] | None) -> List[str]:
@@ -25,6 +64,37 @@ def merge_errors(existing: List[str] | None, new: List[str] | None) -> List[str]
     return existing + new
 
 
+# ──────────────────────────── Accessors ────────────────────────────
+
+
+def get_security_report(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return the serialised SecurityReport from state.
+
+    The report normally lives in the blob store behind ``security_report_ref``
+    so checkpoints carry a short key instead of every finding; an inline
+    ``security_report`` is used as the fallback. If the blob is gone (expired,
+    swept by another process, or the checkpoint was written on another host)
+    a stub with ``unavailable=True`` and the verdict from state is returned,
+    so summaries say the report is missing rather than that no scan ran.
+    """
+    ref = state.get("security_report_ref")
+    if ref:
+        from src.utils.blobs import get_blob
+
+        try:
+            return get_blob(ref)
+        except OSError as e:
+            logger.warning("Security report {} is unavailable: {}", ref, str(e))
+            if not state.get("security_report"):
+                return {
+                    "unavailable": True,
+                    "passed": state.get("security_passed", True),
+                    "findings": [],
+                }
+    return state.get("security_report")
+
+
 # ──────────────────────────── State Schema ────────────────────────────
 
 
@@ -55,7 +125,10 @@ class AfterburnerState(TypedDict):
 
     # ===== Security =====
     security_report: Optional[Dict[str, Any]]
-    """Serialised SecurityReport (dict form for LangGraph compatibility)."""
+    """Serialised SecurityReport — only set inline when the blob store is unavailable."""
+
+    security_report_ref: Optional[str]
+    """Blob-store reference to the serialised SecurityReport (see get_security_report)."""
 
     security_passed: bool
     """Whether the security gate passed."""
@@ -64,8 +137,9 @@ class AfterburnerState(TypedDict):
     """Total number of security findings."""
 
     # ===== Testing =====
-    test_results: Annotated[List[Dict[str, Any]], merge_lists]
-    """Serialised TestRun objects (list of dicts)."""
+    test_results: Annotated[List[Dict[str, Any]], merge_test_results]
+    """Serialised TestRun objects (list of dicts), latest run per framework.
+    Fields at their TestRun default are omitted — read them with .get(key, default)."""
 
     tests_passed: bool
     """Whether all tests passed."""
@@ -73,6 +147,9 @@ class AfterburnerState(TypedDict):
     test_debug_iterations: int
     """Current self-debug loop iteration count (max from settings)."""
 
+    detected_frameworks: Optional[List[str]]
+    """Test frameworks found on the first Test Pilot pass; reused by retries."""
+
     # ===== Git & PR =====
     branch_name: Optional[str]
     commit_sha: Optional[str]
@@ -84,6 +161,9 @@ class AfterburnerState(TypedDict):
     deployment_status: Optional[str]
     """Deployment status: 'success' | 'failed' | 'skipped'."""
 
+    deployment_health: Optional[Dict[str, Any]]
+    """Health-check result for the deployed URL (None if not probed)."""
+
     monitoring_configured: bool
 
     # ===== Workflow Control =====
@@ -4,15 +4,6 @@ from typing import Literal
 from langgraph.graph import StateGraph, END
 
 from src.graph.state import AfterburnerState
-from src.agents.change_detector import change_detector_node
-from src.agents.security_sentinel import security_sentinel_node
-from src.agents.test_pilot import test_pilot_node
-from src.agents.git_guardian import git_guardian_node
-from src.agents.launch_controller import (
-    launch_controller_node,
-    summarize_node,
-    hard_fail_node,
-)
 from src.config import settings
 
 from loguru import logger
@@ -91,6 +82,18 @@ def create_afterburner_workflow(checkpointer=None):
     Returns:
         Compiled LangGraph workflow.
     """
+    # Agents (and their LangChain / tool dependencies) load only when a graph
+    # is actually built, not when this module is imported.
+    from src.agents.change_detector import change_detector_node
+    from src.agents.security_sentinel import security_sentinel_node
+    from src.agents.test_pilot import test_pilot_node
+    from src.agents.git_guardian import git_guardian_node
+    from src.agents.launch_controller import (
+        launch_controller_node,
+        summarize_node,
+        hard_fail_node,
+    )
+
     workflow = StateGraph(AfterburnerState)
 
     # ── Add Nodes ──
@@ -178,17 +181,20 @@ def run_afterburner(
         "trigger_source": trigger_source,
         "file_types": None,
         "security_report": None,
+        "security_report_ref": None,
         "security_passed": False,
         "security_issues_count": 0,
         "test_results": [],
         "tests_passed": False,
         "test_debug_iterations": 0,
+        "detected_frameworks": None,
         "branch_name": None,
         "commit_sha": None,
         "pr_url": None,
         "pr_number": None,
         "deployment_url": None,
         "deployment_status": None,
+        "deployment_health": None,
         "monitoring_configured": False,
         "current_stage": "starting",
         "reflection_count": 0,
@@ -216,5 +222,7 @@ def run_afterburner(
         result = workflow.invoke(initial_state)
 
     logger.info("🏁 Afterburner complete: stage={}", result.get("current_stage"))
+    # Sinks are enqueued — flush pending records before handing back the result
+    logger.complete()
 
     return result
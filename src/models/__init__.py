@@ -1,5 +1,5 @@
 """Data models package."""
 
-from .reports import SecurityFinding, SecurityReport, TestRun, DeployResult
+from .reports import SecurityFinding, SecurityReport, TestRun, DeployResult, TriageItem
 
-__all__ = ["SecurityFinding", "SecurityReport", "TestRun", "DeployResult"]
+__all__ = ["SecurityFinding", "SecurityReport", "TestRun", "DeployResult", "TriageItem"]
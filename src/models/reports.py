@@ -1,10 +1,16 @@
 """Data models for Afterburner reports and results."""
 
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from collections import Counter
+from typing import Any, Dict, List, Literal, Mapping, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
+from pydantic.dataclasses import dataclass
 
 
-class SecurityFinding(BaseModel):
+# A scan can produce thousands of findings: a slotted, frozen dataclass has no
+# per-instance __dict__ and still validates like a model. Construct with
+# keywords; use dataclasses.replace() to change a field.
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SecurityFinding:
     """A single finding from a security scan tool."""
 
     tool: str = Field(description="Scanner that produced this finding: semgrep | bandit | cargo_audit | npm_audit")
@@ -15,24 +21,53 @@ class SecurityFinding(BaseModel):
     rule_id: Optional[str] = Field(default=None, description="Scanner rule ID (e.g. B307 for bandit)")
 
 
+class TriageItem(BaseModel):
+    """One entry of the LLM's security triage response."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    index: int = Field(description="Position of the finding in the triage prompt")
+    severity: Literal["critical", "warning", "info"] = Field(description="Re-classified severity")
+    reason: str = Field(default="", description="Short justification from the LLM")
+
+
 class SecurityReport(BaseModel):
     """Aggregated security scan report across all tools."""
 
     findings: List[SecurityFinding] = Field(default_factory=list)
     passed: bool = Field(default=True, description="True if no findings at or above the blocking severity")
+    incomplete_scans: List[str] = Field(default_factory=list, description="Scanners that timed out, crashed or produced unreadable output")
     scan_duration_ms: float = Field(default=0.0, description="Total scan time in milliseconds")
 
+    # Severity histogram and critical subset, built once when the report is
+    # validated so the counters below are plain lookups.
+    _counts: Counter = PrivateAttr(default_factory=Counter)
+    _critical_findings: List[SecurityFinding] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def _index_findings(self) -> "SecurityReport":
+        self._counts = Counter(f.severity for f in self.findings)
+        self._critical_findings = [f for f in self.findings if f.severity == "critical"]
+        return self
+
+    @computed_field
     @property
     def critical_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == "critical")
+        return self._counts["critical"]
 
+    @computed_field
     @property
     def warning_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == "warning")
+        return self._counts["warning"]
 
+    @computed_field
     @property
     def info_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == "info")
+        return self._counts["info"]
+
+    @property
+    def critical_findings(self) -> List[SecurityFinding]:
+        return self._critical_findings
 
 
 class TestRun(BaseModel):
@@ -76,71 +111,155 @@ class AfterburnerReport(BaseModel):
 
     def to_markdown(self) -> str:
         """Generate a rich Markdown summary of the Afterburner run."""
-        lines = ["# 🚀 Afterburner Report\n"]
-
-        # Changes
-        lines.append("## Changes Detected")
-        lines.append(f"- {len(self.changed_files)} file(s) changed")
-        if self.diff_summary:
-            lines.append(f"- {self.diff_summary}")
-        for f in self.changed_files[:10]:
-            lines.append(f"  - `{f}`")
-        if len(self.changed_files) > 10:
-            lines.append(f"  - ... and {len(self.changed_files) - 10} more")
-        lines.append("")
-
-        # Security
-        if self.security_report:
-            sr = self.security_report
-            icon = "✅" if sr.passed else "❌"
-            lines.append(f"## Security {icon}")
-            lines.append(f"- Critical: {sr.critical_count}")
-            lines.append(f"- Warnings: {sr.warning_count}")
-            lines.append(f"- Info: {sr.info_count}")
-            if not sr.passed:
-                for finding in sr.findings:
-                    if finding.severity == "critical":
-                        lines.append(f"  - **{finding.tool}**: {finding.message} (`{finding.file}:{finding.line}`)")
-            lines.append("")
-
-        # Tests
-        if self.test_results:
-            all_ok = all(tr.all_passed for tr in self.test_results)
-            icon = "✅" if all_ok else "❌"
-            lines.append(f"## Tests {icon}")
-            for tr in self.test_results:
-                lines.append(f"- {tr.framework}: {tr.passed} passed, {tr.failed} failed ({tr.duration_ms:.0f}ms)")
-            lines.append("")
-
-        # Git
-        if self.branch_name or self.commit_sha or self.pr_url:
-            lines.append("## Git")
-            if self.branch_name:
-                lines.append(f"- Branch: `{self.branch_name}`")
-            if self.commit_sha:
-                lines.append(f"- Commit: `{self.commit_sha[:8]}`")
-            if self.pr_url:
-                lines.append(f"- PR: [{self.pr_url}]({self.pr_url})")
-            lines.append("")
-
-        # Deployment
-        if self.deployment and self.deployment.status != "skipped":
-            icon = "✅" if self.deployment.status == "success" else "❌"
-            lines.append(f"## Deployment {icon}")
-            lines.append(f"- Target: {self.deployment.target}")
-            if self.deployment.url:
-                lines.append(f"- URL: {self.deployment.url}")
-            lines.append(f"- Status: {self.deployment.status}")
-            lines.append("")
-
-        # Errors
-        if self.errors:
-            lines.append("## ⚠️ Errors")
-            for err in self.errors:
-                lines.append(f"- {err}")
-            lines.append("")
-
-        if self.hard_fail:
-            lines.append("> ❌ **Pipeline hard-failed.** See errors above for details.\n")
-
-        return "\n".join(lines)
+        return render_markdown(
+            self.security_report.model_dump() if self.security_report else None,
+            [tr.model_dump() for tr in self.test_results],
+            self.deployment.model_dump() if self.deployment else None,
+            {
+                "changed_files": self.changed_files,
+                "diff_summary": self.diff_summary,
+                "branch_name": self.branch_name,
+                "commit_sha": self.commit_sha,
+                "pr_url": self.pr_url,
+                "hard_fail": self.hard_fail,
+                "errors": self.errors,
+            },
+        )
+
+
+def render_markdown(
+    security: Optional[Dict[str, Any]],
+    tests: List[Dict[str, Any]],
+    deployment: Optional[Dict[str, Any]],
+    meta: Mapping[str, Any],
+) -> str:
+    """
+    Generate the Markdown run summary straight from serialised report dicts.
+
+    Works on the ``model_dump()`` forms carried in graph state, so the
+    summary step doesn't re-validate data that was validated when produced.
+
+    Args:
+        security: Serialised SecurityReport, or None if no scan ran.
+        tests: Serialised TestRun dicts.
+        deployment: Serialised DeployResult, or None.
+        meta: Remaining run fields — changed_files, diff_summary, branch_name,
+            commit_sha, pr_url, hard_fail, errors (the state dict works as-is).
+
+    Returns:
+        The report as a Markdown string.
+    """
+    changed_files = meta.get("changed_files") or []
+    diff_summary = meta.get("diff_summary") or ""
+    branch_name = meta.get("branch_name")
+    commit_sha = meta.get("commit_sha")
+    pr_url = meta.get("pr_url")
+    errors = meta.get("errors") or []
+
+    lines: List[str] = ["# 🚀 Afterburner Report\n"]
+    # Bound once: the body below is mostly appends
+    append = lines.append
+    extend = lines.extend
+
+    # Changes
+    append("## Changes Detected")
+    append(f"- {len(changed_files)} file(s) changed")
+    if diff_summary:
+        append(f"- {diff_summary}")
+    extend([f"  - `{f}`" for f in changed_files[:10]])
+    if len(changed_files) > 10:
+        append(f"  - ... and {len(changed_files) - 10} more")
+    append("")
+
+    # Security
+    if security and security.get("unavailable"):
+        # Only the verdict survived — the blob behind security_report_ref is gone
+        extend((
+            f"## Security {'✅' if security.get('passed', True) else '❌'}",
+            "- Report unavailable (expired from the blob store) — re-run the scan for details",
+            "",
+        ))
+    elif security:
+        findings = security.get("findings", [])
+        passed = security.get("passed", True)
+        if "critical_count" in security:
+            # Dumped by a current SecurityReport — counts were computed at validation
+            counts: Dict[str, int] = {
+                "critical": security["critical_count"],
+                "warning": security.get("warning_count", 0),
+                "info": security.get("info_count", 0),
+            }
+        else:
+            counts = {"critical": 0, "warning": 0, "info": 0}
+            for finding in findings:
+                severity = finding.get("severity")
+                if severity in counts:
+                    counts[severity] += 1
+        icon = "✅" if passed else "❌"
+        extend((
+            f"## Security {icon}",
+            f"- Critical: {counts['critical']}",
+            f"- Warnings: {counts['warning']}",
+            f"- Info: {counts['info']}",
+        ))
+        if security.get("incomplete_scans"):
+            append(f"- Incomplete scans: {', '.join(security['incomplete_scans'])}")
+        if not passed:
+            extend([
+                f"  - **{finding.get('tool')}**: {finding.get('message')} "
+                f"(`{finding.get('file')}:{finding.get('line')}`)"
+                for finding in findings
+                if finding.get("severity") == "critical"
+            ])
+        append("")
+
+    # Tests
+    if tests:
+        all_ok = all(not tr.get("failed") and not tr.get("errors") for tr in tests)
+        icon = "✅" if all_ok else "❌"
+        append(f"## Tests {icon}")
+        extend([
+            f"- {tr.get('framework')}: {tr.get('passed', 0)} passed, "
+            f"{tr.get('failed', 0)} failed ({tr.get('duration_ms', 0.0):.0f}ms)"
+            for tr in tests
+        ])
+        append("")
+
+    # Git
+    if branch_name or commit_sha or pr_url:
+        append("## Git")
+        if branch_name:
+            append(f"- Branch: `{branch_name}`")
+        if commit_sha:
+            append(f"- Commit: `{commit_sha[:8]}`")
+        if pr_url:
+            append(f"- PR: [{pr_url}]({pr_url})")
+        append("")
+
+    # Deployment
+    if deployment and deployment.get("status") != "skipped":
+        status = deployment.get("status")
+        icon = "✅" if status == "success" else "❌"
+        append(f"## Deployment {icon}")
+        append(f"- Target: {deployment.get('target')}")
+        if deployment.get("url"):
+            append(f"- URL: {deployment['url']}")
+        append(f"- Status: {status}")
+        health = deployment.get("health")
+        if health:
+            if health.get("healthy"):
+                append(f"- Health: ✅ `{health.get('url')}` ({health.get('response_time_ms', 0):.0f}ms)")
+            else:
+                append(f"- Health: ❌ {health.get('error')}")
+        append("")
+
+    # Errors
+    if errors:
+        append("## ⚠️ Errors")
+        extend([f"- {err}" for err in errors])
+        append("")
+
+    if meta.get("hard_fail"):
+        append("> ❌ **Pipeline hard-failed.** See errors above for details.\n")
+
+    return "\n".join(lines)
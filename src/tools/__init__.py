@@ -1,17 +1,38 @@
 """Tools package — wrappers for external CLIs and APIs."""
 
 from .git_tools import get_changed_files, get_diff_summary, create_branch, commit, push
-from .security_tools import run_semgrep, run_bandit, run_npm_audit, run_cargo_audit
+from .security_tools import (
+    run_semgrep,
+    run_bandit,
+    run_npm_audit,
+    run_cargo_audit,
+    run_all_security_scans,
+    run_all_security_scans_async,
+)
 from .test_tools import detect_test_framework, run_pytest, run_vitest, run_cargo_test, run_playwright
-from .github_tools import create_pr, add_pr_comment, get_codeowners
-from .deploy_tools import deploy_vercel, deploy_docker_compose
-from .monitoring_tools import setup_sentry, generate_prometheus_config, verify_health
+from .github_tools import create_pr, add_pr_comment, add_pr_comments, get_codeowners
+from .deploy_tools import (
+    deploy_vercel,
+    deploy_docker_compose,
+    deploy_vercel_async,
+    deploy_docker_compose_async,
+)
+from .monitoring_tools import (
+    setup_sentry,
+    generate_prometheus_config,
+    verify_health,
+    verify_health_async,
+    run_health_check,
+)
 
 __all__ = [
     "get_changed_files", "get_diff_summary", "create_branch", "commit", "push",
-    "run_semgrep", "run_bandit", "run_npm_audit", "run_cargo_audit",
+    "run_semgrep", "run_bandit", "run_npm_audit", "run_cargo_audit", "run_all_security_scans",
+    "run_all_security_scans_async",
     "detect_test_framework", "run_pytest", "run_vitest", "run_cargo_test", "run_playwright",
-    "create_pr", "add_pr_comment", "get_codeowners",
+    "create_pr", "add_pr_comment", "add_pr_comments", "get_codeowners",
     "deploy_vercel", "deploy_docker_compose",
+    "deploy_vercel_async", "deploy_docker_compose_async",
     "setup_sentry", "generate_prometheus_config", "verify_health",
+    "verify_health_async", "run_health_check",
 ]
@@ -1,14 +1,32 @@
 """Deploy tools — wrappers for Vercel and Docker Compose deployment."""
 
-import subprocess
+import asyncio
 import os
+import re
 from typing import Optional
 
 from loguru import logger
 from src.models.reports import DeployResult
+from src.utils.proc import run_sync, run_with_tail_async
 
 
-def deploy_vercel(
+# Trailing output lines kept from a deploy; builds can print tens of MB
+DEPLOY_TAIL_LINES = 200
+
+_URL_RE = re.compile(r"https?://\S+")
+
+
+def _deployment_url(output: str) -> str:
+    """Return the last URL printed by the Vercel CLI, or its last line if none."""
+    lines = output.strip().split("\n")
+    for line in reversed(lines):
+        match = _URL_RE.search(line)
+        if match:
+            return match.group(0)
+    return lines[-1].strip()
+
+
+async def deploy_vercel_async(
     repo_path: str,
     token: Optional[str] = None,
     prod: bool = True,
@@ -35,30 +53,26 @@ def deploy_vercel(
         cmd.extend(["--token", token])
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=180,
-            cwd=repo_path,
+        returncode, output = await run_with_tail_async(
+            cmd, cwd=repo_path, timeout=180, max_lines=DEPLOY_TAIL_LINES,
         )
 
-        if result.returncode == 0:
-            # Vercel prints the deployment URL as last line of stdout
-            url = result.stdout.strip().split("\n")[-1].strip()
+        if returncode == 0:
+            # Vercel prints the deployment URL near the end of its output
+            url = _deployment_url(output)
             logger.info("Deployed to Vercel: {}", url)
             return DeployResult(
                 target="vercel",
                 url=url,
                 status="success",
-                logs=result.stdout[:1000],
+                logs=output[-1000:],
             )
         else:
-            logger.error("Vercel deploy failed: {}", result.stderr[:500])
+            logger.error("Vercel deploy failed: {}", output[-500:])
             return DeployResult(
                 target="vercel",
                 status="failed",
-                logs=(result.stdout + "\n" + result.stderr)[:1000],
+                logs=output[-1000:],
             )
 
     except FileNotFoundError:
@@ -67,7 +81,7 @@ def deploy_vercel(
             status="failed",
             logs="Vercel CLI not found. Install with: npm i -g vercel",
         )
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return DeployResult(
             target="vercel",
             status="failed",
@@ -75,7 +89,7 @@ def deploy_vercel(
         )
 
 
-def deploy_docker_compose(
+async def deploy_docker_compose_async(
     repo_path: str,
     compose_file: str = "docker-compose.yml",
     build: bool = True,
@@ -109,28 +123,24 @@ def deploy_docker_compose(
         cmd.append("-d")
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-            cwd=repo_path,
+        returncode, output = await run_with_tail_async(
+            cmd, cwd=repo_path, timeout=300, max_lines=DEPLOY_TAIL_LINES,
         )
 
-        if result.returncode == 0:
+        if returncode == 0:
             logger.info("Docker Compose deployment successful")
             return DeployResult(
                 target="docker",
                 url="http://localhost",
                 status="success",
-                logs=result.stdout[:1000],
+                logs=output[-1000:],
             )
         else:
-            logger.error("Docker Compose failed: {}", result.stderr[:500])
+            logger.error("Docker Compose failed: {}", output[-500:])
             return DeployResult(
                 target="docker",
                 status="failed",
-                logs=(result.stdout + "\n" + result.stderr)[:1000],
+                logs=output[-1000:],
             )
 
     except FileNotFoundError:
@@ -139,7 +149,7 @@ def deploy_docker_compose(
             status="failed",
             logs="Docker not found. Install Docker Desktop.",
         )
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return DeployResult(
             target="docker",
             status="failed",
@@ -147,28 +157,30 @@ def deploy_docker_compose(
         )
 
 
-def generate_github_actions_workflow(repo_path: str) -> str:
-    """
-    Generate a GitHub Actions CI/CD workflow file.
-
-    Creates .github/workflows/afterburner.yml if it doesn't exist.
-
-    Args:
-        repo_path: Absolute path to the repository.
+def deploy_vercel(
+    repo_path: str,
+    token: Optional[str] = None,
+    prod: bool = True,
+) -> DeployResult:
+    """Blocking wrapper around deploy_vercel_async() for synchronous callers."""
+    return run_sync(deploy_vercel_async(repo_path, token=token, prod=prod))
 
-    Returns:
-        Path to the generated workflow file.
-    """
-    workflow_dir = os.path.join(repo_path, ".github", "workflows")
-    workflow_path = os.path.join(workflow_dir, "afterburner.yml")
 
-    if os.path.exists(workflow_path):
-        logger.debug("GitHub Actions workflow already exists, skipping generation")
-        return workflow_path
+def deploy_docker_compose(
+    repo_path: str,
+    compose_file: str = "docker-compose.yml",
+    build: bool = True,
+    detach: bool = True,
+) -> DeployResult:
+    """Blocking wrapper around deploy_docker_compose_async() for synchronous callers."""
+    return run_sync(deploy_docker_compose_async(
+        repo_path, compose_file=compose_file, build=build, detach=detach,
+    ))
 
-    os.makedirs(workflow_dir, exist_ok=True)
 
-    workflow_content = """name: Afterburner CI/CD
+# Static CI workflow written by generate_github_actions_workflow(). Encoded
+# once at import; the text isn't pure ASCII, so it can't be a bytes literal.
+_WORKFLOW_YAML: bytes = """name: Afterburner CI/CD
 
 on:
   push:
@@ -209,10 +221,37 @@ jobs:
           path: |
             bandit-report.json
             semgrep-report.json
-"""
+""".encode("utf-8")
+
+
+def generate_github_actions_workflow(repo_path: str) -> str:
+    """
+    Generate a GitHub Actions CI/CD workflow file.
+
+    Creates .github/workflows/afterburner.yml if it doesn't exist.
+
+    Args:
+        repo_path: Absolute path to the repository.
+
+    Returns:
+        Path to the generated workflow file.
+    """
+    workflow_dir = os.path.join(repo_path, ".github", "workflows")
+    workflow_path = os.path.join(workflow_dir, "afterburner.yml")
+
+    os.makedirs(workflow_dir, exist_ok=True)
 
-    with open(workflow_path, "w") as f:
-        f.write(workflow_content)
+    # O_EXCL makes "create only if missing" a single atomic open — no
+    # exists()/open() race with another run generating the same file.
+    try:
+        fd = os.open(workflow_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        logger.debug("GitHub Actions workflow already exists, skipping generation")
+        return workflow_path
+    try:
+        os.write(fd, _WORKFLOW_YAML)
+    finally:
+        os.close(fd)
 
     logger.info("Generated GitHub Actions workflow: {}", workflow_path)
     return workflow_path
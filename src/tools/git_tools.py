@@ -1,12 +1,57 @@
 """Git tools — GitPython wrappers for diff, branch, commit, push operations."""
 
-from typing import List, Optional, Dict
-from pathlib import Path
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from typing import List, Optional, Dict, Tuple
 
 import git
 from loguru import logger
 
 
+# CPython spawns with posix_spawn() instead of fork()+exec() — cheap even when
+# the parent process is large — only if close_fds is False, no cwd is given and
+# the executable is a path with a directory. _run_git meets all three: git is
+# resolved once and the repository is selected with ``git -C``.
+_CLOSE_FDS = sys.platform == "win32"
+
+
+@functools.lru_cache(maxsize=1)
+def _git_executable() -> str:
+    """Absolute path of git (or plain "git" if it isn't on PATH)."""
+    return shutil.which("git") or "git"
+
+# Branches Afterburner never commits to directly
+_PROTECTED_BRANCHES = frozenset({"main", "master", "develop", "dev"})
+
+
+def _run_git(repo_path: str, *args: str, input: Optional[str] = None) -> str:
+    """
+    Run a git subcommand in repo_path and return its stdout.
+
+    ``input``, if given, is written to the command's stdin.
+
+    Raises:
+        git.GitCommandError: If git exits non-zero (same as GitPython's repo.git.*).
+    """
+    cmd = [_git_executable(), "-C", repo_path, *args]
+    result = subprocess.run(
+        cmd,
+        input=input,
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        close_fds=_CLOSE_FDS,
+    )
+    if result.returncode != 0:
+        raise git.GitCommandError(cmd, result.returncode, result.stderr, result.stdout)
+    # Match GitPython, which drops the single trailing newline
+    return result.stdout[:-1] if result.stdout.endswith("\n") else result.stdout
+
+
 def get_changed_files(repo_path: str, ref: str = "HEAD") -> List[str]:
     """
     Get list of changed file paths relative to the given ref.
@@ -21,35 +66,38 @@ def get_changed_files(repo_path: str, ref: str = "HEAD") -> List[str]:
     Returns:
         List of relative file paths that changed.
     """
-    repo = git.Repo(repo_path)
-
+    # -z output is NUL-separated and unquoted, so names with spaces,
+    # newlines or non-ASCII characters come through verbatim.
     # Try diff against ref
     try:
-        diff_output = repo.git.diff("--name-only", ref)
-        if diff_output.strip():
-            files = [f.strip() for f in diff_output.strip().split("\n") if f.strip()]
+        files = _split_z(_run_git(repo_path, "diff", "--name-only", "-z", ref))
+        if files:
             logger.info("Found {} changed files vs {}", len(files), ref)
             return files
     except git.GitCommandError:
         logger.debug("Could not diff against {}, trying staged files", ref)
 
     # Fall back to staged files
-    staged_output = repo.git.diff("--name-only", "--cached")
-    if staged_output.strip():
-        files = [f.strip() for f in staged_output.strip().split("\n") if f.strip()]
+    files = _split_z(_run_git(repo_path, "diff", "--name-only", "-z", "--cached"))
+    if files:
         logger.info("Found {} staged files", len(files))
         return files
 
     # Fall back to untracked files
-    untracked = repo.untracked_files
+    untracked = _split_z(_run_git(repo_path, "ls-files", "--others", "--exclude-standard", "-z"))
     if untracked:
         logger.info("Found {} untracked files", len(untracked))
-        return list(untracked)
+        return untracked
 
     logger.warning("No changed, staged, or untracked files found")
     return []
 
 
+def _split_z(output: str) -> List[str]:
+    """Split NUL-terminated git output (``-z``) into its non-empty entries."""
+    return [entry for entry in output.split("\0") if entry]
+
+
 def get_diff_summary(repo_path: str, ref: str = "HEAD") -> str:
     """
     Get a human-readable diff summary (git diff --stat).
@@ -61,11 +109,10 @@ def get_diff_summary(repo_path: str, ref: str = "HEAD") -> str:
     Returns:
         The git diff --stat output as a string.
     """
-    repo = git.Repo(repo_path)
     try:
-        return repo.git.diff("--stat", ref)
+        return _run_git(repo_path, "diff", "--stat", ref)
     except git.GitCommandError:
-        return repo.git.diff("--stat", "--cached")
+        return _run_git(repo_path, "diff", "--stat", "--cached")
 
 
 def get_full_diff(repo_path: str, ref: str = "HEAD") -> str:
@@ -79,11 +126,48 @@ def get_full_diff(repo_path: str, ref: str = "HEAD") -> str:
     Returns:
         Full unified diff as a string.
     """
-    repo = git.Repo(repo_path)
     try:
-        return repo.git.diff(ref)
+        return _run_git(repo_path, "diff", ref)
+    except git.GitCommandError:
+        return _run_git(repo_path, "diff", "--cached")
+
+
+def get_worktree_fingerprint(repo_path: str) -> Tuple[str, str]:
+    """
+    Cheaply identify the current repository state for cache keys.
+
+    The digest covers `git status --porcelain` plus the mtime and size of every
+    listed path, so it changes when HEAD moves, when a file changes status, and
+    when an already-modified file is edited again.
+
+    Args:
+        repo_path: Absolute path to the git repository.
+
+    Returns:
+        Tuple of (HEAD sha or "" on an unborn branch, hex digest of the worktree).
+    """
+    try:
+        head_sha = _run_git(repo_path, "rev-parse", "--verify", "-q", "HEAD")
     except git.GitCommandError:
-        return repo.git.diff("--cached")
+        head_sha = ""
+
+    porcelain = _run_git(repo_path, "status", "--porcelain", "-z", "--untracked-files=all")
+    digest = hashlib.blake2b(porcelain.encode(), digest_size=16)
+
+    entries = iter(porcelain.split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        if entry[0] in "RC":
+            next(entries, None)  # renames/copies carry the original path as an extra entry
+        path = entry[3:]
+        try:
+            st = os.stat(os.path.join(repo_path, path))
+        except OSError:
+            continue  # deleted — the status line already records it
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+
+    return head_sha, digest.hexdigest()
 
 
 def classify_file_types(files: List[str]) -> Dict[str, List[str]]:
@@ -97,42 +181,65 @@ def classify_file_types(files: List[str]) -> Dict[str, List[str]]:
         Dict mapping type names to file lists.
     """
     type_map: Dict[str, List[str]] = {}
-    extension_types = {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".jsx": "javascript",
-        ".tsx": "typescript",
-        ".rs": "rust",
-        ".go": "go",
-        ".java": "java",
-        ".json": "config",
-        ".yaml": "config",
-        ".yml": "config",
-        ".toml": "config",
-        ".md": "docs",
-        ".txt": "docs",
-        ".html": "web",
-        ".css": "web",
-        ".scss": "web",
-        ".dockerfile": "docker",
-    }
 
     for file_path in files:
-        ext = Path(file_path).suffix.lower()
-        name = Path(file_path).name.lower()
+        type_map.setdefault(_file_type(file_path), []).append(file_path)
 
-        # Special file name checks
-        if name == "dockerfile" or name.startswith("dockerfile."):
-            file_type = "docker"
-        elif name == "docker-compose.yml" or name == "docker-compose.yaml":
-            file_type = "docker"
-        else:
-            file_type = extension_types.get(ext, "other")
+    return type_map
 
-        type_map.setdefault(file_type, []).append(file_path)
 
-    return type_map
+def summarize_file_types(file_types: Dict[str, List[str]]) -> str:
+    """Render per-type counts, e.g. 'python(3), docs(1)' — O(types), not O(files)."""
+    return ", ".join(f"{k}({len(v)})" for k, v in file_types.items())
+
+
+_EXTENSION_TYPES: Dict[str, str] = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "javascript",
+    ".tsx": "typescript",
+    ".rs": "rust",
+    ".go": "go",
+    ".java": "java",
+    ".json": "config",
+    ".yaml": "config",
+    ".yml": "config",
+    ".toml": "config",
+    ".md": "docs",
+    ".txt": "docs",
+    ".html": "web",
+    ".css": "web",
+    ".scss": "web",
+    ".dockerfile": "docker",
+}
+
+
+# Exact (lower-cased) file names that are classified regardless of extension
+_NAME_TYPES: Dict[str, str] = {
+    "dockerfile": "docker",
+    "docker-compose.yml": "docker",
+    "docker-compose.yaml": "docker",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_type(file_path: str) -> str:
+    """Classify a single path with plain string operations (no Path objects)."""
+    name = file_path.rsplit("/", 1)[-1].lower()
+
+    # Special file name checks
+    file_type = _NAME_TYPES.get(name)
+    if file_type is not None:
+        return file_type
+    if name.startswith("dockerfile."):
+        return "docker"
+
+    # Same rules as Path.suffix: a leading dot (".env") or a trailing one is no suffix
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return "other"
+    return _EXTENSION_TYPES.get(name[dot:], "other")
 
 
 def create_branch(repo_path: str, branch_name: str) -> str:
@@ -150,9 +257,8 @@ def create_branch(repo_path: str, branch_name: str) -> str:
 
     # Check if already on a feature branch (not main/master/develop)
     current = repo.active_branch.name
-    protected = {"main", "master", "develop", "dev"}
 
-    if current not in protected:
+    if current not in _PROTECTED_BRANCHES:
         logger.info("Already on feature branch '{}', skipping branch creation", current)
         return current
 
@@ -181,12 +287,17 @@ def commit(
     Returns:
         The commit SHA.
     """
-    repo = git.Repo(repo_path)
-
-    # Stage only the specified files
-    repo.index.add(files)
+    # Stage only the specified files — one git process reads every path from
+    # stdin (NUL-separated) instead of GitPython stat-ing and hashing each one.
+    if files:
+        _run_git(
+            repo_path, "add", "--pathspec-from-file=-", "--pathspec-file-nul", "--",
+            input="\0".join(files),
+        )
     logger.debug("Staged {} files", len(files))
 
+    repo = git.Repo(repo_path)
+
     # Commit
     commit_args = {}
     if sign:
@@ -213,8 +324,7 @@ def push(repo_path: str, branch: Optional[str] = None) -> bool:
     branch = branch or repo.active_branch.name
 
     try:
-        origin = repo.remote("origin")
-        origin.push(branch)
+        _run_git(repo_path, "push", "origin", branch)
         logger.info("Pushed branch '{}' to origin", branch)
         return True
     except Exception as e:
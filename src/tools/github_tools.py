@@ -1,10 +1,43 @@
 """GitHub tools — PyGithub wrappers for PR creation and management."""
 
+import functools
 import os
-from typing import List, Optional
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
+import httpx
 from loguru import logger
 
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
+
+@functools.lru_cache(maxsize=1)
+def _github_class() -> Optional[type]:
+    """
+    Import PyGithub once and return its ``Github`` class, or None if missing.
+
+    Resolved on first use rather than at module import: PyGithub takes ~200ms
+    to import and most commands (security, test, deploy) never talk to GitHub.
+    """
+    try:
+        from github import Github
+    except ImportError:
+        return None
+    return Github
+
+
+@functools.lru_cache(maxsize=8)
+def _get_repo(token: str, repo_name: str) -> "Repository":
+    """
+    Return a PyGithub Repository, reusing the client and its HTTP session.
+
+    Cached per (token, repo), so a PR followed by several comments performs a
+    single TLS handshake and a single ``GET /repos/{owner}/{repo}``. Failed
+    lookups raise and are therefore not cached.
+    """
+    return _github_class()(token, pool_size=10).get_repo(repo_name)
+
 
 def create_pr(
     repo_name: str,
@@ -32,16 +65,16 @@ def create_pr(
     Returns:
         Dict with 'url', 'number', and 'html_url' keys.
     """
-    from github import Github
-
     token = github_token or os.environ.get("AFTERBURNER_GITHUB_TOKEN")
     if not token:
         logger.error("GitHub token not provided — cannot create PR")
         return {"url": None, "number": None, "html_url": None, "error": "No GitHub token"}
+    if _github_class() is None:
+        logger.error("PyGithub is not installed — cannot create PR")
+        return {"url": None, "number": None, "html_url": None, "error": "PyGithub not installed"}
 
     try:
-        g = Github(token)
-        repo = g.get_repo(repo_name)
+        repo = _get_repo(token, repo_name)
 
         pr = repo.create_pull(
             title=title,
@@ -52,19 +85,23 @@ def create_pr(
 
         logger.info("Created PR #{}: {}", pr.number, pr.html_url)
 
-        # Apply labels
-        if labels:
-            try:
-                pr.set_labels(*labels)
-            except Exception as e:
-                logger.warning("Could not apply labels: {}", str(e))
-
-        # Request reviewers
-        if reviewers:
-            try:
-                pr.create_review_request(reviewers=reviewers)
-            except Exception as e:
-                logger.warning("Could not request reviewers: {}", str(e))
+        # Labels and reviewers in one GraphQL round-trip; REST if that can't be done
+        if (labels or reviewers) and not _label_and_request_reviews(
+            token, repo_name, pr.node_id, labels or [], reviewers or [],
+        ):
+            # Apply labels
+            if labels:
+                try:
+                    pr.set_labels(*labels)
+                except Exception as e:
+                    logger.warning("Could not apply labels: {}", str(e))
+
+            # Request reviewers
+            if reviewers:
+                try:
+                    pr.create_review_request(reviewers=reviewers)
+                except Exception as e:
+                    logger.warning("Could not request reviewers: {}", str(e))
 
         return {
             "url": pr.html_url,
@@ -77,6 +114,120 @@ def create_pr(
         return {"url": None, "number": None, "html_url": None, "error": str(e)}
 
 
+# ──────────────────────────── GraphQL ────────────────────────────
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# (repo_name, "label" | "user", name) → GraphQL node ID. Only resolved IDs
+# are stored, so a label created later is picked up on the next PR.
+_NODE_IDS: Dict[Tuple[str, str, str], str] = {}
+
+
+def _graphql(token: str, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """POST one GraphQL document and return the full response payload."""
+    response = httpx.post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"bearer {token}"},
+        timeout=15.0,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _resolve_node_ids(token: str, repo_name: str, labels: List[str], logins: List[str]) -> bool:
+    """
+    Fill _NODE_IDS for the given label names and user logins in one query.
+
+    Returns:
+        True if every label and user now has a known node ID.
+    """
+    missing_labels = [n for n in labels if (repo_name, "label", n) not in _NODE_IDS]
+    missing_users = [n for n in logins if (repo_name, "user", n) not in _NODE_IDS]
+    if not missing_labels and not missing_users:
+        return True
+
+    variables: Dict[str, Any] = {}
+    params = []
+    if missing_labels:
+        # GraphQL rejects declared-but-unused variables, so only add these when needed
+        variables["owner"], variables["name"] = repo_name.split("/", 1)
+        params += ["$owner: String!", "$name: String!"]
+    label_fields = []
+    for i, label in enumerate(missing_labels):
+        variables[f"l{i}"] = label
+        params.append(f"$l{i}: String!")
+        label_fields.append(f"l{i}: label(name: $l{i}) {{ id }}")
+    user_fields = []
+    for i, login in enumerate(missing_users):
+        variables[f"u{i}"] = login
+        params.append(f"$u{i}: String!")
+        user_fields.append(f"u{i}: user(login: $u{i}) {{ id }}")
+
+    query = f"query({', '.join(params)}) {{ "
+    if label_fields:
+        query += f"repository(owner: $owner, name: $name) {{ {' '.join(label_fields)} }} "
+    query += " ".join(user_fields) + " }"
+
+    # Unknown labels / users come back as null with an entry in "errors"
+    data = _graphql(token, query, variables).get("data") or {}
+    repository = data.get("repository") or {}
+    for i, label in enumerate(missing_labels):
+        node = repository.get(f"l{i}")
+        if node:
+            _NODE_IDS[(repo_name, "label", label)] = node["id"]
+    for i, login in enumerate(missing_users):
+        node = data.get(f"u{i}")
+        if node:
+            _NODE_IDS[(repo_name, "user", login)] = node["id"]
+
+    return all((repo_name, "label", n) in _NODE_IDS for n in labels) and all(
+        (repo_name, "user", n) in _NODE_IDS for n in logins
+    )
+
+
+def _label_and_request_reviews(
+    token: str,
+    repo_name: str,
+    pr_node_id: str,
+    labels: List[str],
+    reviewers: List[str],
+) -> bool:
+    """
+    Add labels and request reviewers on a PR with a single GraphQL mutation.
+
+    Returns:
+        True if both were applied; False if the caller should fall back to
+        REST (e.g. a label doesn't exist yet — REST creates it, GraphQL can't).
+    """
+    try:
+        if not _resolve_node_ids(token, repo_name, labels, reviewers):
+            return False
+
+        params = ["$pr: ID!"]
+        fields = []
+        variables: Dict[str, Any] = {"pr": pr_node_id}
+        if labels:
+            params.append("$labelIds: [ID!]!")
+            fields.append("labels: addLabelsToLabelable(input: {labelableId: $pr, labelIds: $labelIds}) { clientMutationId }")
+            variables["labelIds"] = [_NODE_IDS[(repo_name, "label", n)] for n in labels]
+        if reviewers:
+            params.append("$userIds: [ID!]")
+            fields.append("reviews: requestReviews(input: {pullRequestId: $pr, userIds: $userIds}) { clientMutationId }")
+            variables["userIds"] = [_NODE_IDS[(repo_name, "user", n)] for n in reviewers]
+
+        payload = _graphql(token, f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}", variables)
+        if payload.get("errors"):
+            logger.debug("GraphQL label/review mutation failed: {}", payload["errors"])
+            return False
+    except Exception as e:
+        logger.debug("GraphQL label/review request failed: {}", str(e))
+        return False
+
+    logger.debug("Applied {} label(s) and {} reviewer(s) via GraphQL", len(labels), len(reviewers))
+    return True
+
+
 def add_pr_comment(
     repo_name: str,
     pr_number: int,
@@ -95,29 +246,60 @@ def add_pr_comment(
     Returns:
         True if comment was added successfully.
     """
-    from github import Github
+    return add_pr_comments(repo_name, pr_number, [body], github_token=github_token) == 1
+
+
+def add_pr_comments(
+    repo_name: str,
+    pr_number: int,
+    bodies: List[str],
+    github_token: Optional[str] = None,
+) -> int:
+    """
+    Add several comments to an existing Pull Request, fetching the PR once.
 
+    Args:
+        repo_name: Repository in 'owner/repo' format.
+        pr_number: PR number.
+        bodies: Comment bodies (Markdown), posted in order.
+        github_token: GitHub personal access token.
+
+    Returns:
+        Number of comments that were added successfully.
+    """
     token = github_token or os.environ.get("AFTERBURNER_GITHUB_TOKEN")
     if not token:
         logger.error("GitHub token not provided")
-        return False
+        return 0
+    if _github_class() is None:
+        logger.error("PyGithub is not installed — cannot comment on PR #{}", pr_number)
+        return 0
 
     try:
-        g = Github(token)
-        repo = g.get_repo(repo_name)
-        pr = repo.get_pull(pr_number)
-        pr.create_issue_comment(body)
-        logger.info("Added comment to PR #{}", pr_number)
-        return True
+        pr = _get_repo(token, repo_name).get_pull(pr_number)
     except Exception as e:
         logger.error("Failed to comment on PR #{}: {}", pr_number, str(e))
-        return False
+        return 0
+
+    added = 0
+    for body in bodies:
+        try:
+            pr.create_issue_comment(body)
+            added += 1
+        except Exception as e:
+            logger.error("Failed to comment on PR #{}: {}", pr_number, str(e))
+    if added:
+        logger.info("Added {} comment(s) to PR #{}", added, pr_number)
+    return added
 
 
 def get_codeowners(repo_path: str) -> List[str]:
     """
     Parse CODEOWNERS file to extract reviewer usernames.
 
+    The parsed result is cached per (file, mtime), so repeated PRs from a
+    long-running server only re-read the file after it changes.
+
     Args:
         repo_path: Absolute path to the repository.
 
@@ -131,26 +313,35 @@ def get_codeowners(repo_path: str) -> List[str]:
     ]
 
     for path in codeowners_paths:
-        if os.path.exists(path):
-            try:
-                with open(path, "r") as f:
-                    owners = set()
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            # Extract @usernames (not team handles)
-                            parts = line.split()
-                            for part in parts[1:]:  # Skip the file pattern
-                                if part.startswith("@") and "/" not in part:
-                                    owners.add(part.lstrip("@"))
-                    logger.debug("Found CODEOWNERS: {}", owners)
-                    return list(owners)
-            except Exception as e:
-                logger.warning("Failed to parse CODEOWNERS: {}", str(e))
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        try:
+            return list(_parse_codeowners(path, mtime_ns))
+        except Exception as e:
+            logger.warning("Failed to parse CODEOWNERS: {}", str(e))
 
     return []
 
 
+# Leading blanks and whole-line comments, removed before owners are matched
+_LEADING_RE = re.compile(r"(?m)^[ \t]*(?:#.*)?")
+# An @user owner token: preceded by a blank (so never the leading file
+# pattern) and containing no "/" (so @org/team handles are skipped)
+_OWNER_RE = re.compile(r"(?<=[ \t])@+([^\s/]+)(?=\s|$)")
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_codeowners(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Read one CODEOWNERS file; ``mtime_ns`` only keys the cache."""
+    with open(path, "r") as f:
+        text = f.read()
+    owners: Set[str] = set(_OWNER_RE.findall(_LEADING_RE.sub("", text)))
+    logger.debug("Found CODEOWNERS: {}", owners)
+    return tuple(owners)
+
+
 def generate_pr_body(
     diff_summary: str,
     security_passed: bool,
@@ -1,11 +1,15 @@
 """Monitoring tools — Sentry, Prometheus config, and health checks."""
 
+import asyncio
 import os
+import time
 from typing import Optional
 
 import httpx
 from loguru import logger
 
+from src.utils.proc import run_sync
+
 
 def setup_sentry(repo_path: str, dsn: Optional[str] = None) -> bool:
     """
@@ -103,8 +107,6 @@ def verify_health(
     Returns:
         Dict with 'healthy', 'status_code', 'response_time_ms', and 'error' keys.
     """
-    import time
-
     health_paths = ["/health", "/api/health", "/healthz", "/"]
 
     for path in health_paths:
@@ -145,3 +147,80 @@ def verify_health(
         "url": url,
         "error": "All health check endpoints failed",
     }
+
+
+# Probed in preference order; the first healthy one wins
+_HEALTH_PATHS = ["/health", "/api/health", "/healthz", "/"]
+
+
+async def verify_health_async(
+    url: str,
+    timeout: float = 5.0,
+    retries: int = 3,
+    expected_status: int = 200,
+    backoff: float = 0.5,
+) -> dict:
+    """
+    Verify a deployment by probing its health endpoints concurrently.
+
+    All candidate paths are requested at once over one pooled connection set;
+    if none is healthy the round is retried with exponential backoff, which
+    covers deployments that are still warming up. Worst case is roughly
+    ``retries * timeout`` plus backoff, instead of ``len(paths) * timeout``.
+
+    Args:
+        url: URL to check (e.g. https://my-app.vercel.app).
+        timeout: Per-request timeout in seconds.
+        retries: Number of probe rounds.
+        expected_status: Expected HTTP status code.
+        backoff: Delay before the second round; doubles each round.
+
+    Returns:
+        Dict with 'healthy', 'status_code', 'response_time_ms', 'url', and 'error' keys.
+    """
+    check_urls = [url.rstrip("/") + path for path in _HEALTH_PATHS]
+
+    async def _probe(client: httpx.AsyncClient, check_url: str) -> Optional[tuple]:
+        start = time.perf_counter()
+        try:
+            response = await client.get(check_url)
+        except httpx.HTTPError as e:
+            logger.debug("Health check failed for {}: {}", check_url, str(e))
+            return None
+        return response.status_code, (time.perf_counter() - start) * 1000
+
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        for attempt in range(retries):
+            results = await asyncio.gather(*(_probe(client, u) for u in check_urls))
+            for check_url, result in zip(check_urls, results):
+                if result and result[0] == expected_status:
+                    status_code, elapsed_ms = result
+                    logger.info(
+                        "Health check passed: {} → {} ({:.0f}ms)",
+                        check_url,
+                        status_code,
+                        elapsed_ms,
+                    )
+                    return {
+                        "healthy": True,
+                        "status_code": status_code,
+                        "response_time_ms": elapsed_ms,
+                        "url": check_url,
+                        "error": None,
+                    }
+            if attempt < retries - 1:
+                await asyncio.sleep(backoff * (2 ** attempt))
+
+    logger.warning("All health check paths failed for {}", url)
+    return {
+        "healthy": False,
+        "status_code": None,
+        "response_time_ms": None,
+        "url": url,
+        "error": "All health check endpoints failed",
+    }
+
+
+def run_health_check(url: str, timeout: float = 5.0, retries: int = 3) -> dict:
+    """Blocking entry point for verify_health_async()."""
+    return run_sync(verify_health_async(url, timeout=timeout, retries=retries))
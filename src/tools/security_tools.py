@@ -1,12 +1,118 @@
 """Security tools — wrappers for Semgrep, Bandit, cargo audit, npm audit."""
 
-import json
+import asyncio
+import concurrent.futures
+import functools
+import os
 import subprocess
 import time
-from typing import List, Optional
+from typing import Annotated, Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError, ValidatorFunctionWrapHandler, WrapValidator
+from typing_extensions import TypedDict
+
+from src.config import settings
 from src.models.reports import SecurityFinding, SecurityReport
+from src.utils import json_compat
+from src.utils.scan_cache import get_or_compute, get_or_compute_per_file
+
+
+# ──── Semgrep report schema ────
+# Only the fields the parser reads. Validating the raw bytes against this in
+# pydantic-core skips materialising everything else (metadata, code lines,
+# fingerprints, dataflow traces), which is most of a Semgrep report. Each
+# result is validated on its own: one that doesn't fit becomes None instead
+# of failing the whole report.
+
+class _SemgrepPosition(TypedDict, total=False):
+    line: Optional[int]
+
+
+class _SemgrepExtra(TypedDict, total=False):
+    severity: str
+    message: str
+
+
+class _SemgrepResult(TypedDict, total=False):
+    check_id: str
+    path: str
+    start: _SemgrepPosition
+    extra: _SemgrepExtra
+
+
+def _result_or_none(value: Any, handler: ValidatorFunctionWrapHandler) -> Optional[_SemgrepResult]:
+    try:
+        return handler(value)
+    except ValidationError:
+        return None
+
+
+class _SemgrepReport(TypedDict, total=False):
+    results: List[Annotated[Optional[_SemgrepResult], WrapValidator(_result_or_none)]]
+
+
+_SEMGREP_REPORT = TypeAdapter(_SemgrepReport)
+
+
+# Scanner severity → SecurityFinding severity
+_SEMGREP_SEVERITY = {"ERROR": "critical", "WARNING": "warning", "INFO": "info"}
+_BANDIT_SEVERITY = {"HIGH": "critical", "MEDIUM": "warning", "LOW": "info"}
+
+# Smallest shard worth its own Bandit process (interpreter start-up is ~0.5s)
+BANDIT_SHARD_MIN_FILES = 20
+
+
+class ScanOutcome(NamedTuple):
+    """Findings of one scanner run, and whether the scanner actually completed."""
+
+    findings: List[SecurityFinding]
+    # False after a timeout, crash or unreadable output — such results are
+    # never cached and are listed in SecurityReport.incomplete_scans.
+    complete: bool = True
+
+
+def _scan_error(tool: str, message: str) -> ScanOutcome:
+    """Incomplete outcome for a scan whose output couldn't be used."""
+    return ScanOutcome(
+        [SecurityFinding(tool=tool, severity="warning", file="<error>", message=message)],
+        complete=False,
+    )
+
+
+def _scan_timeout(tool: str, label: str, seconds: int) -> ScanOutcome:
+    """Incomplete outcome for a scan that was killed after ``seconds``."""
+    logger.error("{} timed out after {}s", label, seconds)
+    return ScanOutcome(
+        [SecurityFinding(
+            tool=tool,
+            severity="warning",
+            file="<timeout>",
+            message=f"{label} timed out after {seconds} seconds",
+        )],
+        complete=False,
+    )
+
+
+def _run_json_tool(cmd: List[str], repo_path: str, timeout: float) -> bytes:
+    """
+    Run a scanner that reports JSON on stdout and return the raw bytes.
+
+    stdout stays as bytes — json_compat.loads() takes them directly, so the report is
+    never held as a second, decoded str copy — and stderr (progress noise) is
+    discarded rather than buffered.
+
+    Raises:
+        FileNotFoundError: If the scanner isn't installed.
+        subprocess.TimeoutExpired: If it runs longer than ``timeout``.
+    """
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=timeout,
+        cwd=repo_path,
+    ).stdout
 
 
 def run_semgrep(repo_path: str, files: Optional[List[str]] = None) -> List[SecurityFinding]:
@@ -20,55 +126,68 @@ def run_semgrep(repo_path: str, files: Optional[List[str]] = None) -> List[Secur
     Returns:
         List of SecurityFinding objects.
     """
+    return _semgrep_scan(repo_path, files).findings
+
+
+def _semgrep_scan(repo_path: str, files: Optional[List[str]] = None) -> ScanOutcome:
     cmd = ["semgrep", "scan", "--json", "--quiet"]
 
     if files:
-        for f in files:
-            cmd.extend(["--include", f])
-
-    cmd.append(repo_path)
+        # Pass the files as targets (relative to cwd=repo_path) so Semgrep
+        # walks only the change set instead of the whole repo. Deleted files
+        # are dropped — a missing target is an error.
+        targets = [f for f in files if os.path.isfile(os.path.join(repo_path, f))]
+        if not targets:
+            logger.debug("No existing files in changeset — skipping Semgrep")
+            return ScanOutcome([])
+        cmd.extend(targets)
+    else:
+        cmd.append(repo_path)
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=repo_path,
-        )
-        return _parse_semgrep_output(result.stdout)
+        return _parse_semgrep_output(_run_json_tool(cmd, repo_path, timeout=120))
     except FileNotFoundError:
         logger.warning("Semgrep not installed — skipping. Install with: pip install semgrep")
-        return []
+        return ScanOutcome([])
     except subprocess.TimeoutExpired:
-        logger.error("Semgrep timed out after 120s")
-        return [SecurityFinding(
-            tool="semgrep",
-            severity="warning",
-            file="<timeout>",
-            message="Semgrep scan timed out after 120 seconds",
-        )]
+        return _scan_timeout("semgrep", "Semgrep scan", 120)
 
 
-def _parse_semgrep_output(raw_json: str) -> List[SecurityFinding]:
+def _parse_semgrep_output(raw_json: Union[str, bytes]) -> ScanOutcome:
     """Parse Semgrep JSON output into SecurityFinding objects."""
-    findings = []
+    if not raw_json.strip():
+        logger.warning("Semgrep produced no output")
+        return _scan_error("semgrep", "Semgrep exited without a JSON report")
     try:
-        data = json.loads(raw_json) if raw_json.strip() else {"results": []}
-        for r in data.get("results", []):
-            severity_map = {"ERROR": "critical", "WARNING": "warning", "INFO": "info"}
-            findings.append(SecurityFinding(
-                tool="semgrep",
-                severity=severity_map.get(r.get("extra", {}).get("severity", "INFO"), "info"),
-                file=r.get("path", "unknown"),
-                line=r.get("start", {}).get("line"),
-                message=r.get("extra", {}).get("message", r.get("check_id", "unknown")),
-                rule_id=r.get("check_id"),
-            ))
-    except json.JSONDecodeError:
+        data = _SEMGREP_REPORT.validate_json(raw_json)
+    except ValidationError:
         logger.warning("Failed to parse Semgrep JSON output")
-
-    return findings
+        return _scan_error("semgrep", "Semgrep JSON output could not be parsed")
+
+    # One comprehension with the lookups bound locally — reports can hold
+    # tens of thousands of results.
+    results = data.get("results", [])
+    severity = _SEMGREP_SEVERITY.get
+    finding = SecurityFinding
+    findings = [
+        finding(
+            tool="semgrep",
+            severity=severity(r.get("extra", {}).get("severity", "INFO"), "info"),
+            file=r.get("path", "unknown"),
+            line=r.get("start", {}).get("line"),
+            message=r.get("extra", {}).get("message", r.get("check_id", "unknown")),
+            rule_id=r.get("check_id"),
+        )
+        for r in results
+        if r is not None
+    ]
+    invalid = len(results) - len(findings)
+    if invalid:
+        # Keep every readable finding, but don't let the unreadable ones pass silently
+        logger.warning("Skipped {} malformed Semgrep results", invalid)
+        error = _scan_error("semgrep", f"{invalid} Semgrep results could not be parsed")
+        return ScanOutcome(findings + error.findings, complete=False)
+    return ScanOutcome(findings)
 
 
 def run_bandit(repo_path: str, files: Optional[List[str]] = None) -> List[SecurityFinding]:
@@ -82,15 +201,54 @@ def run_bandit(repo_path: str, files: Optional[List[str]] = None) -> List[Securi
     Returns:
         List of SecurityFinding objects.
     """
+    return _bandit_scan(repo_path, files).findings
+
+
+def _bandit_scan(repo_path: str, files: Optional[List[str]] = None) -> ScanOutcome:
     # Filter to Python files only
     if files:
         py_files = [f for f in files if f.endswith(".py")]
         if not py_files:
             logger.debug("No Python files in changeset — skipping Bandit")
-            return []
+            return ScanOutcome([])
     else:
         py_files = None
 
+    # Bandit has no --jobs option and its AST analysis is CPU-bound, so large
+    # change sets are split into contiguous shards run as parallel processes.
+    shard_count = 1
+    if py_files and len(py_files) >= 2 * BANDIT_SHARD_MIN_FILES:
+        shard_count = min(os.cpu_count() or 1, len(py_files) // BANDIT_SHARD_MIN_FILES)
+
+    try:
+        if shard_count <= 1:
+            return _bandit_once(repo_path, py_files)
+        size = -(-len(py_files) // shard_count)  # ceiling division
+        shards = [py_files[i:i + size] for i in range(0, len(py_files), size)]
+        logger.debug("Running Bandit as {} parallel shards", len(shards))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            # A shard that times out reports only itself; the others' findings are kept
+            futures = [
+                executor.submit(
+                    _bandit_once, repo_path, shard,
+                    f"Bandit shard {i + 1}/{len(shards)} ({len(shard)} files)",
+                )
+                for i, shard in enumerate(shards)
+            ]
+            outcomes = [future.result() for future in futures]
+        return ScanOutcome(
+            [finding for outcome in outcomes for finding in outcome.findings],
+            complete=all(outcome.complete for outcome in outcomes),
+        )
+    except FileNotFoundError:
+        logger.warning("Bandit not installed — skipping. Install with: pip install bandit")
+        return ScanOutcome([])
+
+
+def _bandit_once(
+    repo_path: str, py_files: Optional[List[str]], label: str = "Bandit scan",
+) -> ScanOutcome:
+    """Run a single Bandit process over ``py_files`` (or the whole repo if None)."""
     cmd = ["bandit", "-f", "json", "-q"]
 
     if py_files:
@@ -99,47 +257,35 @@ def run_bandit(repo_path: str, files: Optional[List[str]] = None) -> List[Securi
         cmd.extend(["-r", repo_path])
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=repo_path,
-        )
-        return _parse_bandit_output(result.stdout)
-    except FileNotFoundError:
-        logger.warning("Bandit not installed — skipping. Install with: pip install bandit")
-        return []
+        return _parse_bandit_output(_run_json_tool(cmd, repo_path, timeout=120))
     except subprocess.TimeoutExpired:
-        logger.error("Bandit timed out after 120s")
-        return [SecurityFinding(
-            tool="bandit",
-            severity="warning",
-            file="<timeout>",
-            message="Bandit scan timed out after 120 seconds",
-        )]
+        return _scan_timeout("bandit", label, 120)
 
 
-def _parse_bandit_output(raw_json: str) -> List[SecurityFinding]:
+def _parse_bandit_output(raw_json: Union[str, bytes]) -> ScanOutcome:
     """Parse Bandit JSON output into SecurityFinding objects."""
-    findings = []
+    if not raw_json.strip():
+        logger.warning("Bandit produced no output")
+        return _scan_error("bandit", "Bandit exited without a JSON report")
     try:
-        data = json.loads(raw_json) if raw_json.strip() else {"results": []}
-        severity_map = {"HIGH": "critical", "MEDIUM": "warning", "LOW": "info"}
-
-        for r in data.get("results", []):
-            findings.append(SecurityFinding(
-                tool="bandit",
-                severity=severity_map.get(r.get("issue_severity", "LOW"), "info"),
-                file=r.get("filename", "unknown"),
-                line=r.get("line_number"),
-                message=r.get("issue_text", "Unknown issue"),
-                rule_id=r.get("test_id"),
-            ))
-    except json.JSONDecodeError:
+        data = json_compat.loads(raw_json)
+    except json_compat.JSONDecodeError:
         logger.warning("Failed to parse Bandit JSON output")
+        return _scan_error("bandit", "Bandit JSON output could not be parsed")
 
-    return findings
+    severity = _BANDIT_SEVERITY.get
+    finding = SecurityFinding
+    return ScanOutcome([
+        finding(
+            tool="bandit",
+            severity=severity(r.get("issue_severity", "LOW"), "info"),
+            file=r.get("filename", "unknown"),
+            line=r.get("line_number"),
+            message=r.get("issue_text", "Unknown issue"),
+            rule_id=r.get("test_id"),
+        )
+        for r in data.get("results", [])
+    ])
 
 
 def run_npm_audit(repo_path: str) -> List[SecurityFinding]:
@@ -151,34 +297,32 @@ def run_npm_audit(repo_path: str) -> List[SecurityFinding]:
     Returns:
         List of SecurityFinding objects.
     """
-    import os
+    return _npm_audit_scan(repo_path).findings
+
+
+def _npm_audit_scan(repo_path: str) -> ScanOutcome:
     if not os.path.exists(os.path.join(repo_path, "package.json")):
         logger.debug("No package.json found — skipping npm audit")
-        return []
+        return ScanOutcome([])
 
     cmd = ["npm", "audit", "--json"]
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=repo_path,
-        )
-        return _parse_npm_audit_output(result.stdout)
+        return _parse_npm_audit_output(_run_json_tool(cmd, repo_path, timeout=60))
     except FileNotFoundError:
         logger.warning("npm not installed — skipping npm audit")
-        return []
+        return ScanOutcome([])
     except subprocess.TimeoutExpired:
-        logger.error("npm audit timed out")
-        return []
+        return _scan_timeout("npm_audit", "npm audit", 60)
 
 
-def _parse_npm_audit_output(raw_json: str) -> List[SecurityFinding]:
+def _parse_npm_audit_output(raw_json: Union[str, bytes]) -> ScanOutcome:
     """Parse npm audit JSON output."""
+    if not raw_json.strip():
+        logger.warning("npm audit produced no output")
+        return _scan_error("npm_audit", "npm audit exited without a JSON report")
     findings = []
     try:
-        data = json.loads(raw_json) if raw_json.strip() else {}
+        data = json_compat.loads(raw_json)
         severity_map = {"critical": "critical", "high": "critical", "moderate": "warning", "low": "info"}
 
         for vuln_id, vuln in data.get("vulnerabilities", {}).items():
@@ -189,10 +333,11 @@ def _parse_npm_audit_output(raw_json: str) -> List[SecurityFinding]:
                 message=f"{vuln_id}: {vuln.get('title', 'Unknown vulnerability')}",
                 rule_id=vuln_id,
             ))
-    except json.JSONDecodeError:
+    except json_compat.JSONDecodeError:
         logger.warning("Failed to parse npm audit JSON output")
+        return _scan_error("npm_audit", "npm audit JSON output could not be parsed")
 
-    return findings
+    return ScanOutcome(findings)
 
 
 def run_cargo_audit(repo_path: str) -> List[SecurityFinding]:
@@ -204,34 +349,32 @@ def run_cargo_audit(repo_path: str) -> List[SecurityFinding]:
     Returns:
         List of SecurityFinding objects.
     """
-    import os
+    return _cargo_audit_scan(repo_path).findings
+
+
+def _cargo_audit_scan(repo_path: str) -> ScanOutcome:
     if not os.path.exists(os.path.join(repo_path, "Cargo.toml")):
         logger.debug("No Cargo.toml found — skipping cargo audit")
-        return []
+        return ScanOutcome([])
 
     cmd = ["cargo", "audit", "--json"]
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=repo_path,
-        )
-        return _parse_cargo_audit_output(result.stdout)
+        return _parse_cargo_audit_output(_run_json_tool(cmd, repo_path, timeout=60))
     except FileNotFoundError:
         logger.warning("cargo-audit not installed — skipping")
-        return []
+        return ScanOutcome([])
     except subprocess.TimeoutExpired:
-        logger.error("cargo audit timed out")
-        return []
+        return _scan_timeout("cargo_audit", "cargo audit", 60)
 
 
-def _parse_cargo_audit_output(raw_json: str) -> List[SecurityFinding]:
+def _parse_cargo_audit_output(raw_json: Union[str, bytes]) -> ScanOutcome:
     """Parse cargo audit JSON output."""
+    if not raw_json.strip():
+        logger.warning("cargo audit produced no output")
+        return _scan_error("cargo_audit", "cargo audit exited without a JSON report")
     findings = []
     try:
-        data = json.loads(raw_json) if raw_json.strip() else {}
+        data = json_compat.loads(raw_json)
         for vuln in data.get("vulnerabilities", {}).get("list", []):
             advisory = vuln.get("advisory", {})
             findings.append(SecurityFinding(
@@ -241,15 +384,17 @@ def _parse_cargo_audit_output(raw_json: str) -> List[SecurityFinding]:
                 message=f"{advisory.get('id', 'UNKNOWN')}: {advisory.get('title', 'Unknown')}",
                 rule_id=advisory.get("id"),
             ))
-    except json.JSONDecodeError:
+    except json_compat.JSONDecodeError:
         logger.warning("Failed to parse cargo audit JSON output")
+        return _scan_error("cargo_audit", "cargo audit JSON output could not be parsed")
 
-    return findings
+    return ScanOutcome(findings)
 
 
 def aggregate_security_findings(
     findings: List[SecurityFinding],
     block_on: str = "critical",
+    incomplete_scans: Optional[List[str]] = None,
 ) -> SecurityReport:
     """
     Aggregate all findings into a SecurityReport with pass/fail determination.
@@ -257,18 +402,267 @@ def aggregate_security_findings(
     Args:
         findings: All security findings across tools.
         block_on: Minimum severity that causes a fail: 'critical' or 'warning'.
+        incomplete_scans: Names of scanners that didn't complete. Recorded on
+            the report; they only fail it when SECURITY_FAIL_ON_INCOMPLETE_SCAN
+            is set.
 
     Returns:
         SecurityReport with pass/fail status.
     """
-    blocking_severities = {"critical"}
+    incomplete_scans = list(incomplete_scans or [])
+    if incomplete_scans:
+        logger.warning("Incomplete security scans: {}", ", ".join(incomplete_scans))
+    report = SecurityReport(
+        findings=findings,
+        scan_duration_ms=0.0,  # Caller should set this
+        incomplete_scans=incomplete_scans,
+    )
+    # The report's severity histogram is already built — no second pass needed
+    blockers = report.critical_count
     if block_on == "warning":
-        blocking_severities.add("warning")
+        blockers += report.warning_count
+    report.passed = blockers == 0 and not (
+        incomplete_scans and settings.SECURITY_FAIL_ON_INCOMPLETE_SCAN
+    )
+    return report
 
-    has_blockers = any(f.severity in blocking_severities for f in findings)
 
-    return SecurityReport(
-        findings=findings,
-        passed=not has_blockers,
-        scan_duration_ms=0.0,  # Caller should set this
+# Most severe first; used to pick which duplicate survives dedupe_findings()
+_SEVERITY_RANK = {"critical": 0, "warning": 1, "info": 2}
+
+
+def dedupe_findings(findings: List[SecurityFinding]) -> List[SecurityFinding]:
+    """
+    Collapse findings reported more than once for the same (tool, file, line, rule).
+
+    Keeps the most severe copy, in first-seen order. run_scan() applies this
+    before findings reach LLM triage, so duplicates neither inflate the
+    counts nor the triage prompt.
+    """
+    unique: Dict[Tuple[str, str, Optional[int], Optional[str]], SecurityFinding] = {}
+    for f in findings:
+        key = (f.tool, f.file, f.line, f.rule_id)
+        kept = unique.get(key)
+        if kept is None or _SEVERITY_RANK.get(f.severity, 3) < _SEVERITY_RANK.get(kept.severity, 3):
+            unique[key] = f
+    return list(unique.values())
+
+
+# (display name, runner, runner args, files whose content determines the result,
+#  whether the runner analyses each file independently — see run_scan())
+class ScanJob(NamedTuple):
+    """One scanner to run, and what its cached results depend on."""
+
+    name: str
+    fn: Callable[..., ScanOutcome]
+    args: tuple
+    # Files the findings depend on; empty disables the scan cache
+    cache_files: List[str]
+    # Whether ``fn`` analyses each file independently (cached file by file)
+    per_file: bool
+    # Prints the scanner version; a failure (not installed) disables the cache
+    version_cmd: Tuple[str, ...]
+    # Repo config files the scanner reads (directories are expanded)
+    config_files: Tuple[str, ...]
+
+
+# Config files each scanner picks up from the repository, relative to its root
+_SEMGREP_CONFIG = (".semgrep.yml", ".semgrep.yaml", ".semgrep", ".semgrepignore")
+_BANDIT_CONFIG = (".bandit", "pyproject.toml")
+_NPM_CONFIG = (".npmrc",)
+_CARGO_CONFIG = (".cargo/audit.toml", "audit.toml")
+
+
+def plan_security_scans(
+    repo_path: str,
+    changed_files: List[str],
+    file_types: Dict[str, List[str]],
+) -> List[ScanJob]:
+    """
+    Pick the scanners that apply to this change set.
+
+    Args:
+        repo_path: Absolute path to the repository.
+        changed_files: Changed files, relative to ``repo_path``.
+        file_types: Output of classify_file_types() for ``changed_files``.
+
+    Returns:
+        One ScanJob per scanner to run, in report order.
+    """
+    jobs: List[ScanJob] = []
+    if settings.ENABLE_SEMGREP:
+        # Language-agnostic
+        jobs.append(ScanJob("Semgrep", _semgrep_scan, (repo_path, changed_files),
+                            changed_files, True, ("semgrep", "--version"), _SEMGREP_CONFIG))
+    if settings.ENABLE_BANDIT and "python" in file_types:
+        python_files = file_types["python"]
+        jobs.append(ScanJob("Bandit", _bandit_scan, (repo_path, python_files),
+                            python_files, True, ("bandit", "--version"), _BANDIT_CONFIG))
+    if "javascript" in file_types or "typescript" in file_types:
+        jobs.append(ScanJob("npm audit", _npm_audit_scan, (repo_path,),
+                            ["package.json", "package-lock.json"], False,
+                            ("npm", "--version"), _NPM_CONFIG))
+    if "rust" in file_types:
+        jobs.append(ScanJob("cargo audit", _cargo_audit_scan, (repo_path,),
+                            ["Cargo.toml", "Cargo.lock"], False,
+                            ("cargo", "audit", "--version"), _CARGO_CONFIG))
+    return jobs
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_version(cmd: Tuple[str, ...]) -> str:
+    """
+    Output of a scanner's version command, memoized for the process.
+
+    Returns "" when the tool isn't installed or the command fails, which
+    disables the scan cache so a "not installed → no findings" result is
+    never cached.
+    """
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env={**os.environ, "SEMGREP_ENABLE_VERSION_CHECK": "0"},
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def _config_inputs(repo_path: str, names: Tuple[str, ...]) -> List[str]:
+    """Expand config ``names`` into files, walking the ones that are directories."""
+    files: List[str] = []
+    for name in names:
+        root = os.path.join(repo_path, name)
+        if not os.path.isdir(root):
+            # Missing files stay in: creating one later changes the key
+            files.append(name)
+            continue
+        for dirpath, _, filenames in os.walk(root):
+            files.extend(
+                os.path.relpath(os.path.join(dirpath, f), repo_path) for f in filenames
+            )
+    return files
+
+
+def run_scan(job: ScanJob, repo_path: str) -> ScanOutcome:
+    """
+    Run one planned scanner; a crash is logged and reported as an incomplete scan.
+
+    Results are served from the scan cache when the scanner version, the
+    repo's scanner config and the job's input files are unchanged, which
+    makes reflection-loop retries skip the subprocess entirely. Per-file jobs
+    (Semgrep, Bandit) are cached file by file and only the changed files are
+    handed to the scanner. Duplicate findings are collapsed (see
+    dedupe_findings()).
+    """
+    name, fn, args = job.name, job.fn, job.args
+    logger.debug("Running {}...", name)
+    try:
+        # Probed here, in the scan's own worker, so the version commands overlap
+        version = _tool_version(job.version_cmd) if job.cache_files else ""
+        cache_files = job.cache_files if version else []
+        config_files = _config_inputs(repo_path, job.config_files) if cache_files else []
+        if job.per_file and cache_files:
+            findings, complete = get_or_compute_per_file(
+                name, cache_files, repo_path, lambda misses: fn(repo_path, misses),
+                version, config_files,
+            )
+        else:
+            findings, complete = get_or_compute(
+                name, cache_files, repo_path, lambda: fn(*args), version, config_files,
+            )
+    except Exception as e:
+        logger.warning("{} failed: {}", name, str(e))
+        return _scan_error(name.lower().replace(" ", "_"), f"{name} failed: {e}")
+    findings = dedupe_findings(findings)
+    logger.info("{}: {} findings", name, len(findings))
+    return ScanOutcome(findings, complete)
+
+
+def run_all_security_scans(
+    repo_path: str,
+    files: List[str],
+    file_types: Optional[Dict[str, List[str]]] = None,
+    block_on: str = "critical",
+) -> SecurityReport:
+    """
+    Run every applicable scanner concurrently and aggregate the results.
+
+    The scanners are independent subprocesses, so wall time is that of the
+    slowest tool rather than the sum of all of them.
+
+    Args:
+        repo_path: Absolute path to the repository.
+        files: Changed files, relative to ``repo_path``.
+        file_types: Pre-computed classify_file_types() output, if available.
+        block_on: Minimum severity that causes a fail: 'critical' or 'warning'.
+
+    Returns:
+        SecurityReport with findings in scanner order and the scan duration.
+    """
+    if file_types is None:
+        from src.tools.git_tools import classify_file_types
+
+        file_types = classify_file_types(files)
+
+    start_time = time.time()
+    jobs = plan_security_scans(repo_path, files, file_types)
+    outcomes: List[ScanOutcome] = []
+    if jobs:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(run_scan, job, repo_path) for job in jobs]
+            outcomes = [future.result() for future in futures]
+
+    report = aggregate_security_findings(
+        [finding for outcome in outcomes for finding in outcome.findings],
+        block_on=block_on,
+        incomplete_scans=[job[0] for job, outcome in zip(jobs, outcomes) if not outcome.complete],
+    )
+    report.scan_duration_ms = (time.time() - start_time) * 1000
+    return report
+
+
+async def run_all_security_scans_async(
+    repo_path: str,
+    files: List[str],
+    file_types: Optional[Dict[str, List[str]]] = None,
+    block_on: str = "critical",
+) -> SecurityReport:
+    """
+    Coroutine counterpart of run_all_security_scans() for use on an event loop.
+
+    Each planned scanner runs via asyncio.to_thread() and the jobs are
+    gathered, so the scanner processes overlap without blocking the loop. The
+    jobs stay thread-based because the scan cache and Bandit sharding around
+    each subprocess are synchronous.
+
+    Args:
+        repo_path: Absolute path to the repository.
+        files: Changed files, relative to ``repo_path``.
+        file_types: Pre-computed classify_file_types() output, if available.
+        block_on: Minimum severity that causes a fail: 'critical' or 'warning'.
+
+    Returns:
+        SecurityReport with findings in scanner order and the scan duration.
+    """
+    if file_types is None:
+        from src.tools.git_tools import classify_file_types
+
+        file_types = classify_file_types(files)
+
+    start_time = time.time()
+    jobs = plan_security_scans(repo_path, files, file_types)
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(run_scan, job, repo_path) for job in jobs)
+    )
+
+    report = aggregate_security_findings(
+        [finding for outcome in outcomes for finding in outcome.findings],
+        block_on=block_on,
+        incomplete_scans=[job[0] for job, outcome in zip(jobs, outcomes) if not outcome.complete],
     )
+    report.scan_duration_ms = (time.time() - start_time) * 1000
+    return report
@@ -1,75 +1,108 @@
 """Test tools — wrappers for pytest, vitest, cargo test, and Playwright."""
 
-import json
+import functools
 import os
+import re
 import subprocess
-from typing import List, Optional
+import tomllib
+from typing import List, Optional, Tuple, Union
 
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import TypedDict
+
 from src.models.reports import TestRun
+from src.utils import json_compat
+from src.utils.proc import run_with_tail
+
+# "5 passed, 2 failed, 1 skipped, 1 error in 0.42s" — one findall over the summary line
+_PYTEST_COUNT_RE = re.compile(r"(\d+) (passed|failed|skipped|errors?)\b")
+# Lines pytest prints per failing test in its short summary
+_PYTEST_FAILED_RE = re.compile(r"^FAILED .*$", re.MULTILINE)
+# Only the last few lines can hold the final summary
+_PYTEST_SUMMARY_LINES = 20
+# cargo's "test result: ok. X passed; Y failed; ..." line
+_CARGO_RESULT_RE = re.compile(r"(\d+) passed.*?(\d+) failed")
+# The result line is at the very end; compiler warnings before it can be MBs
+_CARGO_TAIL_CHARS = 4096
 
 
 def detect_test_framework(repo_path: str) -> List[str]:
     """
     Auto-detect which test frameworks are available in the project.
 
+    The result is cached per (directory mtime, pyproject.toml mtime), so
+    repeated calls cost two stat() calls until a file is added, removed or
+    pyproject.toml is edited.
+
     Args:
         repo_path: Absolute path to the repository.
 
     Returns:
         List of detected framework names: 'pytest', 'vitest', 'jest', 'cargo', 'playwright'.
     """
+    try:
+        dir_mtime_ns = os.stat(repo_path).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = 0
+    try:
+        pyproject_mtime_ns = os.stat(os.path.join(repo_path, "pyproject.toml")).st_mtime_ns
+    except OSError:
+        pyproject_mtime_ns = 0
+
+    frameworks = list(_detect_frameworks(repo_path, dir_mtime_ns, pyproject_mtime_ns))
+    logger.info("Detected test frameworks: {}", frameworks or ["none"])
+    return frameworks
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_frameworks(repo_path: str, dir_mtime_ns: int, pyproject_mtime_ns: int) -> Tuple[str, ...]:
+    """One directory listing, then in-memory lookups; the mtimes only key the cache."""
+    try:
+        with os.scandir(repo_path) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
+
     frameworks = []
 
     # Python — pytest
-    if any(
-        os.path.exists(os.path.join(repo_path, f))
-        for f in ["pytest.ini", "setup.cfg", "conftest.py"]
-    ) or _has_pyproject_pytest(repo_path):
-        frameworks.append("pytest")
-    elif os.path.exists(os.path.join(repo_path, "tests")) or os.path.exists(
-        os.path.join(repo_path, "test")
+    if not names.isdisjoint(("pytest.ini", "setup.cfg", "conftest.py")) or (
+        "pyproject.toml" in names and _has_pyproject_pytest(repo_path)
     ):
+        frameworks.append("pytest")
+    elif "tests" in names or "test" in names:
         frameworks.append("pytest")  # Assume pytest if tests dir exists
 
     # JavaScript — vitest
-    for name in ["vitest.config.ts", "vitest.config.js", "vitest.config.mts"]:
-        if os.path.exists(os.path.join(repo_path, name)):
-            frameworks.append("vitest")
-            break
+    if not names.isdisjoint(("vitest.config.ts", "vitest.config.js", "vitest.config.mts")):
+        frameworks.append("vitest")
 
     # JavaScript — jest (fallback)
-    if "vitest" not in frameworks:
-        for name in ["jest.config.ts", "jest.config.js", "jest.config.mjs"]:
-            if os.path.exists(os.path.join(repo_path, name)):
-                frameworks.append("jest")
-                break
+    elif not names.isdisjoint(("jest.config.ts", "jest.config.js", "jest.config.mjs")):
+        frameworks.append("jest")
 
     # Rust — cargo test
-    if os.path.exists(os.path.join(repo_path, "Cargo.toml")):
+    if "Cargo.toml" in names:
         frameworks.append("cargo")
 
     # Playwright
-    for name in ["playwright.config.ts", "playwright.config.js"]:
-        if os.path.exists(os.path.join(repo_path, name)):
-            frameworks.append("playwright")
-            break
+    if not names.isdisjoint(("playwright.config.ts", "playwright.config.js")):
+        frameworks.append("playwright")
 
-    logger.info("Detected test frameworks: {}", frameworks or ["none"])
-    return frameworks
+    return tuple(frameworks)
 
 
 def _has_pyproject_pytest(repo_path: str) -> bool:
     """Check if pyproject.toml has pytest configuration."""
     pyproject = os.path.join(repo_path, "pyproject.toml")
-    if os.path.exists(pyproject):
-        try:
-            with open(pyproject, "r") as f:
-                content = f.read()
-                return "[tool.pytest" in content
-        except Exception:
-            pass
-    return False
+    try:
+        with open(pyproject, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return False
+    tool = data.get("tool")
+    return isinstance(tool, dict) and "pytest" in tool
 
 
 def run_pytest(
@@ -97,15 +130,9 @@ def run_pytest(
             cmd.extend(test_files)
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=repo_path,
-        )
-
-        return _parse_pytest_output(result.stdout, result.stderr, result.returncode)
+        # Summary and FAILED lines are at the end — keep only the output tail
+        returncode, output = run_with_tail(cmd, cwd=repo_path, timeout=timeout)
+        return _parse_pytest_output(output, "", returncode)
 
     except FileNotFoundError:
         return TestRun(
@@ -123,35 +150,34 @@ def _parse_pytest_output(stdout: str, stderr: str, returncode: int) -> TestRun:
     """Parse pytest console output into a TestRun."""
     passed = failed = skipped = 0
     errors = []
-    output = stdout + "\n" + stderr
-
-    # Parse the summary line: "5 passed, 2 failed, 1 skipped"
-    for line in stdout.split("\n"):
-        line = line.strip()
-        if "passed" in line or "failed" in line or "error" in line:
-            import re
-            p = re.search(r"(\d+) passed", line)
-            f = re.search(r"(\d+) failed", line)
-            s = re.search(r"(\d+) skipped", line)
-            e = re.search(r"(\d+) error", line)
-            if p:
-                passed = int(p.group(1))
-            if f:
-                failed = int(f.group(1))
-            if s:
-                skipped = int(s.group(1))
-            if e:
-                failed += int(e.group(1))
+
+    # Parse the summary line: "5 passed, 2 failed, 1 skipped" — the last line
+    # with counts, so only the tail is split and searched.
+    tail = stdout.rsplit("\n", _PYTEST_SUMMARY_LINES)
+    if len(tail) > _PYTEST_SUMMARY_LINES:
+        tail = tail[1:]  # drop the unsplit head
+    for line in reversed(tail):
+        counts = _PYTEST_COUNT_RE.findall(line)
+        if counts:
+            for count, kind in counts:
+                if kind == "passed":
+                    passed = int(count)
+                elif kind == "skipped":
+                    skipped = int(count)
+                else:
+                    # Collection / fixture errors count as failures
+                    failed += int(count)
+            break
 
     if returncode != 0 and failed == 0:
         errors.append(f"pytest exited with code {returncode}")
-        if stderr.strip():
-            errors.append(stderr.strip()[:500])
+        # stderr is merged into stdout when run through run_with_tail
+        detail = (stderr or stdout).strip()
+        if detail:
+            errors.append(detail[-500:])
 
     # Extract FAILED test names for self-debug context
-    for line in stdout.split("\n"):
-        if line.startswith("FAILED "):
-            errors.append(line.strip())
+    errors.extend(m.group(0).strip() for m in _PYTEST_FAILED_RE.finditer(stdout))
 
     return TestRun(
         framework="pytest",
@@ -159,10 +185,25 @@ def _parse_pytest_output(stdout: str, stderr: str, returncode: int) -> TestRun:
         failed=failed,
         skipped=skipped,
         errors=errors,
-        output=output[:2000],  # Truncate to avoid bloating state
+        output=_output_head(stdout, stderr),  # Truncate to avoid bloating state
     )
 
 
+def _output_head(stdout: Union[str, bytes], stderr: Union[str, bytes], limit: int = 2000) -> str:
+    """
+    First ``limit`` characters of stdout + stderr for TestRun.output.
+
+    Byte streams are decoded only as far as needed (a UTF-8 character is at
+    most 4 bytes), never in full.
+    """
+    def head(data: Union[str, bytes]) -> str:
+        if isinstance(data, bytes):
+            return data[:limit * 4].decode("utf-8", errors="replace")
+        return data[:limit]
+
+    return (head(stdout) + "\n" + head(stderr))[:limit]
+
+
 def run_vitest(
     repo_path: str,
     files: Optional[List[str]] = None,
@@ -187,10 +228,10 @@ def run_vitest(
             cmd.extend(test_files)
 
     try:
+        # Bytes: the JSON report is parsed without first decoding it to str
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout,
             cwd=repo_path,
         )
@@ -209,10 +250,10 @@ def run_vitest(
         )
 
 
-def _parse_vitest_output(stdout: str, stderr: str) -> TestRun:
+def _parse_vitest_output(stdout: Union[str, bytes], stderr: Union[str, bytes]) -> TestRun:
     """Parse vitest JSON output."""
     try:
-        data = json.loads(stdout) if stdout.strip() else {}
+        data = json_compat.loads(stdout) if stdout.strip() else {}
         passed = data.get("numPassedTests", 0)
         failed = data.get("numFailedTests", 0)
         errors = []
@@ -230,13 +271,13 @@ def _parse_vitest_output(stdout: str, stderr: str) -> TestRun:
             passed=passed,
             failed=failed,
             errors=errors,
-            output=(stdout + "\n" + stderr)[:2000],
+            output=_output_head(stdout, stderr),
         )
-    except json.JSONDecodeError:
+    except json_compat.JSONDecodeError:
         return TestRun(
             framework="vitest",
             errors=["Failed to parse vitest JSON output"],
-            output=(stdout + "\n" + stderr)[:2000],
+            output=_output_head(stdout, stderr),
         )
 
 
@@ -254,15 +295,9 @@ def run_cargo_test(repo_path: str, timeout: int = 300) -> TestRun:
     cmd = ["cargo", "test", "--", "--test-threads=1", "-q"]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=repo_path,
-        )
-
-        return _parse_cargo_test_output(result.stdout, result.stderr, result.returncode)
+        # "test result:" lines are at the end — keep only the output tail
+        returncode, output = run_with_tail(cmd, cwd=repo_path, timeout=timeout)
+        return _parse_cargo_test_output(output, "", returncode)
 
     except FileNotFoundError:
         return TestRun(
@@ -278,16 +313,18 @@ def run_cargo_test(repo_path: str, timeout: int = 300) -> TestRun:
 
 def _parse_cargo_test_output(stdout: str, stderr: str, returncode: int) -> TestRun:
     """Parse cargo test output."""
-    import re
     passed = failed = 0
     errors = []
+    combined = stdout + "\n" + stderr
 
-    # Look for "test result: ok. X passed; Y failed"
-    for line in (stdout + "\n" + stderr).split("\n"):
-        m = re.search(r"(\d+) passed.*?(\d+) failed", line)
-        if m:
-            passed = int(m.group(1))
-            failed = int(m.group(2))
+    # Look for the last "test result: ok. X passed; Y failed" — only the tail
+    # is searched, and "." doesn't cross lines, so each match is one line.
+    last = None
+    for last in _CARGO_RESULT_RE.finditer(combined, max(0, len(combined) - _CARGO_TAIL_CHARS)):
+        pass
+    if last:
+        passed = int(last.group(1))
+        failed = int(last.group(2))
 
     if returncode != 0 and failed == 0:
         errors.append(f"cargo test exited with code {returncode}")
@@ -297,7 +334,7 @@ def _parse_cargo_test_output(stdout: str, stderr: str, returncode: int) -> TestR
         passed=passed,
         failed=failed,
         errors=errors,
-        output=(stdout + "\n" + stderr)[:2000],
+        output=combined[:2000],
     )
 
 
@@ -315,10 +352,10 @@ def run_playwright(repo_path: str, timeout: int = 300) -> TestRun:
     cmd = ["npx", "playwright", "test", "--reporter=json"]
 
     try:
+        # Bytes: the JSON report is parsed without first decoding it to str
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout,
             cwd=repo_path,
         )
@@ -337,10 +374,43 @@ def run_playwright(repo_path: str, timeout: int = 300) -> TestRun:
         )
 
 
-def _parse_playwright_output(stdout: str, stderr: str) -> TestRun:
+# ──── Playwright report schema ────
+# Only the fields the parser reads; pydantic-core skips materialising the rest
+# (attachments, captured stdout/stderr, steps), which dominates large reports.
+
+class _PlaywrightError(TypedDict, total=False):
+    message: str
+
+
+class _PlaywrightResult(TypedDict, total=False):
+    status: str
+    error: Optional[_PlaywrightError]
+
+
+class _PlaywrightTest(TypedDict, total=False):
+    results: List[_PlaywrightResult]
+
+
+class _PlaywrightSpec(TypedDict, total=False):
+    title: str
+    tests: List[_PlaywrightTest]
+
+
+class _PlaywrightSuite(TypedDict, total=False):
+    specs: List[_PlaywrightSpec]
+
+
+class _PlaywrightReport(TypedDict, total=False):
+    suites: List[_PlaywrightSuite]
+
+
+_PLAYWRIGHT_REPORT = TypeAdapter(_PlaywrightReport)
+
+
+def _parse_playwright_output(stdout: Union[str, bytes], stderr: Union[str, bytes]) -> TestRun:
     """Parse Playwright JSON output."""
     try:
-        data = json.loads(stdout) if stdout.strip() else {}
+        data = _PLAYWRIGHT_REPORT.validate_json(stdout) if stdout.strip() else {}
         passed = 0
         failed = 0
         errors = []
@@ -355,7 +425,7 @@ def _parse_playwright_output(stdout: str, stderr: str) -> TestRun:
                             failed += 1
                             errors.append(
                                 f"{spec.get('title', 'unknown')}: "
-                                f"{result.get('error', {}).get('message', 'unknown error')[:200]}"
+                                f"{(result.get('error') or {}).get('message', 'unknown error')[:200]}"
                             )
 
         return TestRun(
@@ -363,11 +433,11 @@ def _parse_playwright_output(stdout: str, stderr: str) -> TestRun:
             passed=passed,
             failed=failed,
             errors=errors,
-            output=(stdout + "\n" + stderr)[:2000],
+            output=_output_head(stdout, stderr),
         )
-    except json.JSONDecodeError:
+    except ValidationError:
         return TestRun(
             framework="playwright",
             errors=["Failed to parse Playwright JSON output"],
-            output=(stdout + "\n" + stderr)[:2000],
+            output=_output_head(stdout, stderr),
         )
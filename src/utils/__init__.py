@@ -1,6 +1,27 @@
-"""Utilities package."""
+"""Utilities package.
 
-from .llm import get_llm
-from .logging import setup_logging
+Exports are resolved lazily (PEP 562) so importing a light helper such as
+``src.utils.text`` does not pull in LangChain through ``src.utils.llm``.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "get_llm": ".llm",
+    "setup_logging": ".logging",
+}
 
 __all__ = ["get_llm", "setup_logging"]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_EXPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,104 @@
+"""Blob store — content-addressed JSON side-store for large state values."""
+
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from src.config import settings
+from src.utils import json_compat
+
+
+# Expired blobs are swept by put_blob() at most this often per process
+_PRUNE_INTERVAL_SECONDS = 3600
+_last_prune = 0.0
+
+
+def _blob_dir() -> Path:
+    return Path(os.path.expanduser(settings.CACHE_DIR)) / "blobs"
+
+
+def _prune(blob_dir: Path) -> None:
+    """Delete blobs (and stray temp files) not written within BLOB_TTL_SECONDS."""
+    cutoff = time.time() - settings.BLOB_TTL_SECONDS
+    try:
+        entries = os.scandir(blob_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass  # Concurrently removed or not ours to delete
+
+
+def put_blob(kind: str, obj: Dict[str, Any]) -> str:
+    """
+    Store ``obj`` as JSON under its content hash and return the reference.
+
+    Identical content maps to the same file, so re-storing an unchanged value
+    on a retry is a hash plus an mtime touch. Blobs not stored again within
+    ``BLOB_TTL_SECONDS`` are deleted by a sweep that runs at most hourly, so
+    a long-running server doesn't grow the directory without bound.
+
+    Args:
+        kind: Short label for the value (e.g. 'security_report'), part of the ref.
+        obj: JSON-serialisable dict.
+
+    Returns:
+        Reference string of the form ``"<kind>:<sha256>"``.
+
+    Raises:
+        OSError: If the blob directory cannot be written.
+    """
+    data = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    blob_dir = _blob_dir()
+    path = blob_dir / f"{digest}.json"
+    try:
+        os.utime(path)  # Still in use — restart its TTL
+    except FileNotFoundError:
+        blob_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    global _last_prune
+    now = time.time()
+    if now - _last_prune >= _PRUNE_INTERVAL_SECONDS:
+        _last_prune = now
+        _prune(blob_dir)
+    return f"{kind}:{digest}"
+
+
+@functools.lru_cache(maxsize=32)
+def _read_blob(digest: str) -> bytes:
+    # Blobs are immutable, so the raw bytes are memoized; each caller still
+    # gets its own parsed dict from get_blob().
+    with open(_blob_dir() / f"{digest}.json", "rb") as f:
+        return f.read()
+
+
+def get_blob(ref: str) -> Dict[str, Any]:
+    """
+    Load a blob stored by put_blob().
+
+    Returns a fresh dict on every call, so callers may mutate it freely. The
+    blob's TTL restarts on every read, so a report that is still being used
+    isn't swept.
+
+    Raises:
+        FileNotFoundError: If the blob no longer exists.
+    """
+    _, _, digest = ref.partition(":")
+    data = _read_blob(digest)
+    try:
+        os.utime(_blob_dir() / f"{digest}.json")
+    except OSError:
+        pass  # Served from memory after a sweep; nothing left to keep alive
+    return json_compat.loads(data)
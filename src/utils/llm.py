@@ -1,16 +1,48 @@
 """LLM client factory — supports Gemini and Groq via LangChain."""
 
-from langchain_core.language_models.chat_models import BaseChatModel
+import functools
+from typing import TYPE_CHECKING, Any, Callable
+
 from src.config import settings
 
+if TYPE_CHECKING:
+    # ~0.5s to import; the provider packages pull it in when a client is built
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+
+class LazyLLMProxy:
+    """
+    Stand-in for a chat model that builds it on first attribute access.
+
+    ``invoke``, ``stream`` etc. are forwarded to the real client, which is
+    constructed — importing the provider SDK — only when first used.
+    """
+
+    __slots__ = ("_factory", "_llm")
+
+    def __init__(self, factory: Callable[[], "BaseChatModel"]):
+        self._factory = factory
+        self._llm = None
+
+    def __getattr__(self, name: str) -> Any:
+        llm = self._llm
+        if llm is None:
+            llm = self._llm = self._factory()
+        return getattr(llm, name)
+
 
 def get_llm(
     provider: str | None = None,
     model: str | None = None,
     temperature: float = 0.2,
-) -> BaseChatModel:
+) -> LazyLLMProxy:
     """
-    Create and return an LLM client based on configuration.
+    Return an LLM client based on configuration.
+
+    The configuration is validated immediately, but the client itself (and
+    its provider SDK import, often hundreds of ms) is only built when the
+    returned proxy is first used. Clients are cached, so repeated calls with
+    the same configuration share one instance.
 
     Args:
         provider: Override the default LLM_PROVIDER from settings.
@@ -18,7 +50,7 @@ def get_llm(
         temperature: Sampling temperature.
 
     Returns:
-        A LangChain chat model instance.
+        A proxy for a LangChain chat model instance.
 
     Raises:
         ValueError: If the provider is unknown or API key is missing.
@@ -27,34 +59,51 @@ def get_llm(
     model = model or settings.LLM_MODEL
 
     if provider == "gemini":
-        if not settings.GEMINI_API_KEY:
-            raise ValueError(
-                "AFTERBURNER_GEMINI_API_KEY is required when LLM_PROVIDER='gemini'. "
-                "Set it in your .env file."
-            )
+        api_key = settings.GEMINI_API_KEY
+    elif provider == "groq":
+        api_key = settings.GROQ_API_KEY
+    else:
+        raise ValueError(
+            f"Unknown LLM provider '{provider}'. Supported: 'gemini', 'groq'."
+        )
+
+    if not api_key:
+        raise ValueError(
+            f"AFTERBURNER_{provider.upper()}_API_KEY is required when LLM_PROVIDER='{provider}'. "
+            "Set it in your .env file."
+        )
+
+    return LazyLLMProxy(functools.partial(_build_llm, provider, model, temperature, api_key))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_llm(
+    provider: str,
+    model: str,
+    temperature: float,
+    api_key: str,
+) -> "BaseChatModel":
+    """
+    Construct a chat model, memoized per (provider, model, temperature, key).
+
+    LangChain chat models are safe to share across threads, so one instance
+    serves every caller (CLI retries, MCP / API worker threads) and reuses its
+    underlying HTTP client. The API key is part of the key so a changed
+    setting yields a fresh client. Failures are not cached.
+    """
+    if provider == "gemini":
         from langchain_google_genai import ChatGoogleGenerativeAI
 
         return ChatGoogleGenerativeAI(
             model=model,
-            google_api_key=settings.GEMINI_API_KEY,
+            google_api_key=api_key,
             temperature=temperature,
         )
 
-    elif provider == "groq":
-        if not settings.GROQ_API_KEY:
-            raise ValueError(
-                "AFTERBURNER_GROQ_API_KEY is required when LLM_PROVIDER='groq'. "
-                "Set it in your .env file."
-            )
-        from langchain_groq import ChatGroq
-
-        return ChatGroq(
-            model=model,
-            groq_api_key=settings.GROQ_API_KEY,
-            temperature=temperature,
-        )
+    from langchain_groq import ChatGroq
 
-    else:
-        raise ValueError(
-            f"Unknown LLM provider '{provider}'. Supported: 'gemini', 'groq'."
-        )
+    return ChatGroq(
+        model=model,
+        groq_api_key=api_key,
+        temperature=temperature,
+    )
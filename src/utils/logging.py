@@ -5,6 +5,17 @@ from loguru import logger
 
 from src.config import settings
 
+_CONFIGURED = False
+
+_COLOR_FORMAT = (
+    "<green>{time:HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+# Same layout without markup, for CI logs and redirected output
+_PLAIN_FORMAT = "{time:HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}"
+
 
 def setup_logging() -> None:
     """
@@ -13,21 +24,49 @@ def setup_logging() -> None:
     Uses VERBOSE setting to control log level:
     - VERBOSE=True  → DEBUG level
     - VERBOSE=False → INFO level
+
+    Idempotent: only the first call installs the sink, so long-running servers
+    can call it per request without re-registering handlers.
+
+    Sinks are enqueued: records are written by a background thread, so log
+    calls in the agents (and their worker threads) never block on I/O. Call
+    ``logger.complete()`` to wait for pending records. Set LOG_FILE to also
+    write a plain-text log file.
+
+    When stderr is not a terminal (CI, redirected output) the console sink
+    uses a markup-free format without colorizing. Tracebacks are logged
+    without Loguru's variable-annotating diagnose/backtrace enrichment.
     """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
     logger.remove()  # Remove default handler
 
     log_level = "DEBUG" if settings.VERBOSE else "INFO"
 
+    is_tty = sys.stderr.isatty()
     logger.add(
         sys.stderr,
         level=log_level,
-        format=(
-            "<green>{time:HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-            "<level>{message}</level>"
-        ),
-        colorize=True,
+        format=_COLOR_FORMAT if is_tty else _PLAIN_FORMAT,
+        colorize=is_tty,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
+    if settings.LOG_FILE:
+        logger.add(
+            settings.LOG_FILE,
+            level=log_level,
+            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
+            buffering=1,
+            encoding="utf-8",
+        )
+    _CONFIGURED = True
+
     logger.debug("Afterburner logging initialised (level={})", log_level)
@@ -0,0 +1,219 @@
+"""Subprocess helpers — bounded output capture and sync entry points for coroutines."""
+
+import asyncio
+import concurrent.futures
+import os
+import signal
+import subprocess
+import sys
+import threading
+from collections import deque
+from typing import Any, Coroutine, List, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# Lines of combined stdout/stderr kept by run_with_tail()
+DEFAULT_TAIL_LINES = 500
+
+# Pipe read size for run_with_tail() / run_with_tail_async()
+_READ_CHUNK = 64 * 1024
+
+# Longest line the tail keeps; longer ones (e.g. "\r" progress bars that
+# never print "\n") keep only their last _MAX_LINE_BYTES
+_MAX_LINE_BYTES = 64 * 1024
+
+# After a timeout kill, how long to wait for the output reader to hit EOF
+_READER_JOIN_SECONDS = 5.0
+
+# POSIX: run the child in its own session so a timeout can kill the whole
+# process group — grandchildren (test binaries, xdist workers, npm/sh
+# children) would otherwise keep the pipe open and the caller blocked. The
+# session is outside the terminal's foreground group, so Ctrl-C doesn't reach
+# it: the helpers kill the group on *any* exit other than normal completion.
+_NEW_SESSION = sys.platform != "win32"
+
+
+def _kill_tree(proc: Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+    """Kill ``proc`` and, on POSIX, every process in its process group."""
+    if _NEW_SESSION:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except (ProcessLookupError, PermissionError):
+            pass
+    proc.kill()
+
+
+class _LineTail:
+    """
+    Splits a byte stream fed in chunks into its last ``max_lines`` lines.
+
+    Splitting is on raw bytes — b"\n" never occurs inside a UTF-8 sequence —
+    and only the kept tail is decoded, once, by text(). The unfinished last
+    line is kept as a list of pieces joined once when its newline arrives, so
+    nothing is re-copied per chunk, and is capped at ``_MAX_LINE_BYTES``.
+    """
+
+    def __init__(self, max_lines: int):
+        self._lines: deque = deque(maxlen=max_lines)
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        end = chunk.find(b"\n")
+        if end < 0:
+            self._pending.append(chunk)
+            self._pending_size += len(chunk)
+            if self._pending_size > 2 * _MAX_LINE_BYTES:
+                # Cap the line, amortised: compact only every few chunks
+                kept = b"".join(self._pending)[-_MAX_LINE_BYTES:]
+                self._pending, self._pending_size = [kept], len(kept)
+            return
+        self._pending.append(chunk[:end])
+        self._push(b"".join(self._pending))
+        *lines, rest = chunk[end + 1:].split(b"\n")
+        for line in lines:
+            self._push(line)
+        self._pending, self._pending_size = [rest], len(rest)
+
+    def _push(self, line: bytes) -> None:
+        self._lines.append(line[-_MAX_LINE_BYTES:].rstrip(b"\r"))
+
+    def text(self) -> str:
+        if self._pending_size:
+            self._push(b"".join(self._pending))
+            self._pending, self._pending_size = [], 0
+        return b"\n".join(self._lines).decode("utf-8", errors="replace")
+
+
+def run_with_tail(
+    cmd: List[str],
+    cwd: str,
+    timeout: float,
+    max_lines: int = DEFAULT_TAIL_LINES,
+) -> Tuple[int, str]:
+    """
+    Run ``cmd`` and return its exit code and the last ``max_lines`` lines of output.
+
+    stdout and stderr are merged and read in fixed-size chunks into a bounded
+    deque, so a verbose test suite never holds more than ``max_lines`` lines
+    of at most ``_MAX_LINE_BYTES`` each in memory. Only suitable for tools whose result is at the end of their text
+    output (pytest, cargo test) — JSON reporters need the full stream.
+
+    Args:
+        cmd: Command and arguments.
+        cwd: Working directory.
+        timeout: Maximum seconds to wait for the process.
+        max_lines: Number of trailing lines to keep.
+
+    Returns:
+        Tuple of (returncode, tail text).
+
+    Raises:
+        FileNotFoundError: If the executable does not exist.
+        subprocess.TimeoutExpired: If the process outlives ``timeout`` (it and
+            its process group are killed, as on KeyboardInterrupt or any other
+            exception while waiting).
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=_NEW_SESSION,
+    )
+    tail = _LineTail(max_lines)
+
+    def _drain() -> None:
+        # read1() returns whatever is available, up to one chunk
+        while True:
+            chunk = proc.stdout.read1(_READ_CHUNK)
+            if not chunk:
+                break
+            tail.feed(chunk)
+
+    reader = threading.Thread(target=_drain, daemon=True)
+    reader.start()
+    try:
+        proc.wait(timeout=timeout)
+    except BaseException:
+        _kill_tree(proc)
+        proc.wait()
+        raise
+    finally:
+        # Bounded: a process outside the group may still hold the pipe open
+        reader.join(_READER_JOIN_SECONDS)
+        proc.stdout.close()
+
+    return proc.returncode, tail.text()
+
+
+async def run_with_tail_async(
+    cmd: List[str],
+    cwd: str,
+    timeout: float,
+    max_lines: int = DEFAULT_TAIL_LINES,
+) -> Tuple[int, str]:
+    """
+    Coroutine counterpart of run_with_tail() for use on an event loop.
+
+    Output is captured the same way, so memory stays at ``max_lines`` lines
+    of at most ``_MAX_LINE_BYTES`` each no matter how much the process prints.
+
+    Args:
+        cmd: Command and arguments.
+        cwd: Working directory.
+        timeout: Maximum seconds to wait for the process.
+        max_lines: Number of trailing lines to keep.
+
+    Returns:
+        Tuple of (returncode, tail text).
+
+    Raises:
+        FileNotFoundError: If the executable does not exist.
+        asyncio.TimeoutError: If the process outlives ``timeout`` (it and its
+            process group are killed, as on cancellation or any other
+            exception while waiting).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=_NEW_SESSION,
+    )
+    tail = _LineTail(max_lines)
+
+    async def _drain() -> None:
+        while True:
+            chunk = await proc.stdout.read(_READ_CHUNK)
+            if not chunk:
+                break
+            tail.feed(chunk)
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(_drain(), timeout=timeout)
+    except BaseException:
+        _kill_tree(proc)
+        # Shielded so a repeated cancellation can't skip reaping the child
+        await asyncio.shield(proc.wait())
+        raise
+
+    return proc.returncode, tail.text()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() directly, or a short-lived worker thread if the caller
+    is already inside a running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
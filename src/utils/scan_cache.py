@@ -0,0 +1,223 @@
+"""Scan cache — reuses security scanner results while the scanned files are unchanged."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from pydantic import TypeAdapter
+
+from src.config import settings
+from src.models.reports import SecurityFinding
+
+# Parses, validates and serialises a whole entry in one pydantic-core call
+_FINDINGS_ADAPTER = TypeAdapter(List[SecurityFinding])
+
+
+def _cache_dir() -> Path:
+    return Path(os.path.expanduser(settings.CACHE_DIR)) / "scans"
+
+
+# Absolute path → (mtime_ns, size, sha256). Lets repeated lookups in one
+# process skip re-hashing files whose stat hasn't changed.
+_DIGESTS: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def _content_digest(path: str) -> bytes:
+    """sha256 of a file's content, re-hashed only when its mtime/size change."""
+    try:
+        st = os.stat(path)
+        cached = _DIGESTS.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).digest()
+    except OSError:
+        # Deleted / unreadable files still participate in the key
+        return b"<missing>"
+    _DIGESTS[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def scan_cache_key(
+    tool: str,
+    files: List[str],
+    repo_path: str,
+    version: str = "",
+    config_files: Sequence[str] = (),
+) -> str:
+    """
+    Build a cache key from the scanner, its configuration and the content of every input file.
+
+    Args:
+        tool: Scanner name (part of the key so tools never share entries).
+        files: Files the scanner reads, relative to ``repo_path`` or absolute.
+        repo_path: Absolute path to the repository.
+        version: Scanner version string, so an upgrade (new rules) misses.
+        config_files: Scanner config files, relative to ``repo_path``; their
+            content is part of the key, missing ones included.
+
+    Returns:
+        Hex digest identifying this exact (tool, version, config, file contents) combination.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(tool.encode())
+    digest.update(b"\0")
+    digest.update(version.encode())
+    digest.update(b"\0")
+    digest.update(os.path.abspath(repo_path).encode())
+    for group in (config_files, files):
+        digest.update(b"\1")
+        for rel in sorted(set(group)):
+            digest.update(b"\0")
+            digest.update(rel.encode())
+            digest.update(b"\0")
+            digest.update(_content_digest(os.path.abspath(os.path.join(repo_path, rel))))
+    return digest.hexdigest()
+
+
+def _load(path: Path) -> Optional[List[SecurityFinding]]:
+    try:
+        if time.time() - path.stat().st_mtime > settings.SCAN_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "rb") as f:
+            return _FINDINGS_ADAPTER.validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable scan cache entry {}: {}", path.name, str(e))
+        return None
+
+
+def _store(path: Path, findings: List[SecurityFinding]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_FINDINGS_ADAPTER.dump_python(findings), f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not write scan cache entry {}: {}", path.name, str(e))
+
+
+def get_or_compute(
+    tool: str,
+    files: List[str],
+    repo_path: str,
+    fn: Callable[[], Tuple[List[SecurityFinding], bool]],
+    version: str = "",
+    config_files: Sequence[str] = (),
+) -> Tuple[List[SecurityFinding], bool]:
+    """
+    Return cached findings for ``tool`` over ``files``, or run ``fn`` and cache them.
+
+    Entries live under ``settings.CACHE_DIR`` (outside the repository, so they
+    never show up as changed files) and expire after ``SCAN_CACHE_TTL_SECONDS``
+    so advisory-database updates are still picked up. Results of scans that
+    didn't complete are never cached.
+
+    Args:
+        tool: Scanner name.
+        files: Files whose content determines the scan result.
+        repo_path: Absolute path to the repository.
+        fn: Zero-argument callable that runs the scanner and returns
+            ``(findings, complete)``.
+        version: Scanner version, see scan_cache_key().
+        config_files: Scanner config files, see scan_cache_key().
+
+    Returns:
+        ``(findings, complete)`` — fresh SecurityFinding instances on every
+        call; cache hits are always complete.
+    """
+    if not settings.ENABLE_SCAN_CACHE or not files:
+        return fn()
+
+    key = scan_cache_key(tool, files, repo_path, version, config_files)
+    path = _cache_dir() / f"{key}.json"
+    cached = _load(path)
+    if cached is not None:
+        logger.debug("{}: inputs unchanged — using cached results", tool)
+        return cached, True
+
+    findings, complete = fn()
+    if complete:
+        _store(path, findings)
+    return findings, complete
+
+
+def _relative(path: str, repo_path: str) -> str:
+    """Normalise a scanner-reported path to one relative to ``repo_path``."""
+    if not os.path.isabs(path):
+        path = os.path.join(repo_path, path)
+    return os.path.relpath(path, repo_path)
+
+
+def get_or_compute_per_file(
+    tool: str,
+    files: List[str],
+    repo_path: str,
+    fn: Callable[[List[str]], Tuple[List[SecurityFinding], bool]],
+    version: str = "",
+    config_files: Sequence[str] = (),
+) -> Tuple[List[SecurityFinding], bool]:
+    """
+    Per-file variant of get_or_compute() for scanners that analyse files independently.
+
+    Each file's findings are cached under its own (tool, content) key, so
+    editing one file of a large change set re-scans just that file: ``fn`` is
+    called with the cache misses only and its findings are merged with the
+    cached ones. When the scan didn't complete, or any finding can't be
+    attributed to a scanned file, the results are returned but nothing is
+    cached.
+
+    Args:
+        tool: Scanner name.
+        files: Files to scan, relative to ``repo_path``.
+        repo_path: Absolute path to the repository.
+        fn: Runs the scanner over the given subset of ``files`` and returns
+            ``(findings, complete)``.
+        version: Scanner version, part of every file's key (see scan_cache_key()).
+        config_files: Scanner config files, part of every file's key.
+
+    Returns:
+        ``(findings, complete)`` with findings grouped in the order of ``files``.
+    """
+    if not settings.ENABLE_SCAN_CACHE or not files:
+        return fn(files)
+
+    entry_dir = _cache_dir() / "files"
+    # Hash the version and config once; each file's key then adds just its own content
+    scanner = scan_cache_key(tool, [], repo_path, version, config_files)
+    results: Dict[str, List[SecurityFinding]] = {}
+    misses: Dict[str, Path] = {}
+    for rel in dict.fromkeys(os.path.normpath(f) for f in files):
+        path = entry_dir / f"{scan_cache_key(scanner, [rel], repo_path)}.json"
+        cached = _load(path)
+        if cached is None:
+            misses[rel] = path
+            results[rel] = []
+        else:
+            results[rel] = cached
+
+    if not misses:
+        logger.debug("{}: all {} files unchanged — using cached results", tool, len(results))
+        return [finding for findings in results.values() for finding in findings], True
+
+    logger.debug("{}: scanning {} of {} files (rest cached)", tool, len(misses), len(results))
+    unattributed: List[SecurityFinding] = []
+    scanned, complete = fn(list(misses))
+    for finding in scanned:
+        rel = _relative(finding.file, repo_path)
+        if rel in misses:
+            results[rel].append(finding)
+        else:
+            unattributed.append(finding)
+
+    if complete and not unattributed:
+        for rel, path in misses.items():
+            _store(path, results[rel])
+    merged = [finding for findings in results.values() for finding in findings]
+    return merged + unattributed, complete
@@ -0,0 +1,37 @@
+"""Text helpers — bounded joins for building LLM prompts and messages."""
+
+from typing import Iterable
+
+
+def head_join(items: Iterable[object], sep: str, limit: int) -> str:
+    """
+    Equivalent to ``sep.join(map(str, items))[:limit]`` without building the full string.
+
+    Stops consuming ``items`` once ``limit`` characters have been produced, so
+    huge test logs or finding lists cost no more than the prefix that is kept.
+
+    Args:
+        items: Values to join (converted with ``str``).
+        sep: Separator placed between items.
+        limit: Maximum length of the result.
+
+    Returns:
+        The first ``limit`` characters of the joined string.
+    """
+    if limit <= 0:
+        return ""
+
+    parts = []
+    length = 0
+    for item in items:
+        if parts:
+            parts.append(sep)
+            length += len(sep)
+            if length >= limit:
+                break
+        text = str(item)[: limit - length]
+        parts.append(text)
+        length += len(text)
+        if length >= limit:
+            break
+    return "".join(parts)[:limit]
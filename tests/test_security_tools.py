@@ -0,0 +1,46 @@
+"""Tests for security finding aggregation and deduplication."""
+
+from src.config import settings
+from src.models.reports import SecurityFinding
+from src.tools.security_tools import aggregate_security_findings, dedupe_findings
+
+
+def _finding(severity: str, line: int = 1, message: str = "issue") -> SecurityFinding:
+    return SecurityFinding(
+        tool="bandit",
+        severity=severity,
+        file="app.py",
+        line=line,
+        message=message,
+        rule_id="B101",
+    )
+
+
+def test_warning_blocks_only_when_configured():
+    findings = [_finding("info", line=1), _finding("warning", line=2)]
+
+    assert aggregate_security_findings(findings).passed is True
+    assert aggregate_security_findings(findings, block_on="warning").passed is False
+
+
+def test_dedupe_keeps_most_severe_duplicate():
+    info = _finding("info", message="first copy")
+    critical = _finding("critical", message="second copy")
+    other = _finding("warning", line=2)
+
+    assert dedupe_findings([info, critical, other]) == [critical, other]
+
+
+def test_incomplete_scan_is_recorded_without_failing_by_default():
+    report = aggregate_security_findings([_finding("info")], incomplete_scans=["Bandit"])
+
+    assert report.passed is True
+    assert report.incomplete_scans == ["Bandit"]
+
+
+def test_incomplete_scan_fails_when_configured(monkeypatch):
+    monkeypatch.setattr(settings, "SECURITY_FAIL_ON_INCOMPLETE_SCAN", True)
+
+    report = aggregate_security_findings([_finding("info")], incomplete_scans=["Bandit"])
+
+    assert report.passed is False